@@ -1,27 +1,42 @@
 import os
+from typing import Optional
 from dotenv import load_dotenv
 
 import openai
 
+from .policy import CircuitOpenError, get_request_policy
+from .rate_limit import RateLimitTimeout, estimate_tokens, get_rate_limiter
+
 load_dotenv()
 API_KEY = os.environ.get("OPENAI_API_KEY")
 
 class BaseAgent:
     """Base class for all agents in the application."""
     
-    def __init__(self):
+    def __init__(self, model: str):
         """Initializes the BaseAgent"""
         try:
-            self.client = openai.OpenAI(api_key=API_KEY)
+            # Retries are handled by the request policy, not by the client.
+            self.client = openai.OpenAI(api_key=API_KEY, max_retries=0)
         except Exception as e:
             print(f"Failed to initialize OpenAI client: {e}")
             raise e
+        self.policy = get_request_policy(model)
+        self.rate_limiter = get_rate_limiter()
+        self.opening_book = None
+        # Whether an unavailable API is answered with a local fallback word. Without it, the error is raised.
+        self.allow_fallback = True
 
     @property
     def simple_word(self):
         """Returns a simple word for the agent."""
         raise NotImplementedError("Subclasses must implement this property.")
 
+    @property
+    def fallback_words(self) -> list:
+        """Returns the local word list used while the API is unavailable."""
+        return [self.simple_word]
+
     def get_historic_state(self, history: list) -> dict:
         """Retrieves the historic and current state of the game."""
         green_letters = {}
@@ -52,6 +67,76 @@ class BaseAgent:
             "yellow_letters": final_yellows
         }
 
+    def fallback_guess(self, history: list) -> str:
+        """Picks a fallback word that fits the feedback so far and has not been guessed yet."""
+        state = self.get_historic_state(history)
+        previous_guesses = {turn["guess"] for turn in history}
+        candidates = [word for word in self.fallback_words if word not in previous_guesses]
+
+        for word in candidates:
+            if any(word[pos] != letter for pos, letter in state["green_letters"].items()):
+                continue
+            if any(letter in word for letter in state["gray_letters"]):
+                continue
+            if not all(letter in word for letter in state["yellow_letters"]):
+                continue
+            return word
+        return candidates[0] if candidates else self.simple_word
+
+    def _book_guess(self, history: list) -> Optional[str]:
+        """Returns the opening book's guess for this turn, if the game is still in the book."""
+        if self.opening_book is None:
+            return None
+        word = self.opening_book.lookup(history)
+        if word is not None:
+            print(f"Opening book suggested: {word}")
+        return word
+
+    @staticmethod
+    def _priority(history: list) -> int:
+        """Rate limiter priority of a game: the more completed attempts, the sooner it gets budget."""
+        return len([turn for turn in history if turn["feedback"] != "INVALID"])
+
+    def _complete(self, messages: list, temperature: float, max_tokens: int = 4, priority: int = 0) -> Optional[str]:
+        """
+        Requests a chat completion under the request policy. Returns None if the API is unavailable,
+        or raises the error instead when `allow_fallback` is off.
+
+        Every request, hedges and retries included, first acquires budget from the shared rate limiter.
+        """
+        extra = {"seed": self.seed} if self.seed is not None else {}
+        tokens = estimate_tokens(messages, max_tokens)
+
+        def acquire(timeout):
+            self.rate_limiter.acquire(self.model, tokens, priority=priority, timeout=timeout)
+
+        def request(timeout):
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                **extra
+            )
+            return response.choices[0].message.content
+
+        try:
+            return self.policy.call(request, acquire=acquire)
+        except CircuitOpenError:
+            if not self.allow_fallback:
+                raise
+            print("OpenAI API is degraded, skipping the request.")
+        except RateLimitTimeout as e:
+            if not self.allow_fallback:
+                raise
+            print(f"Rate limit budget exhausted, skipping the request: {e}")
+        except Exception as e:
+            if not self.allow_fallback:
+                raise
+            print(f"An error occurred with the OpenAI API: {e}")
+        return None
+
     def get_ai_guess(self, history: list) -> str:
         """Generates a guess using the AI client based on the history of attempts."""
         raise NotImplementedError("Subclasses must implement this method.")
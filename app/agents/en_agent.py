@@ -1,9 +1,14 @@
 from .base import BaseAgent
+from .opening_book import OpeningBook
 
 class EnAgent(BaseAgent):
-    def __init__(self, model: str = "gpt-4o-mini"):
-        super().__init__()
+    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.3, seed: int = None, use_opening_book: bool = True):
+        super().__init__(model)
         self.model = model
+        self.temperature = temperature
+        self.seed = seed
+        if use_opening_book:
+            self.opening_book = OpeningBook.load("en")
         self.system_prompt = """
         You are an expert English Wordle solver. You will be given the game state and a list of rules. Your goal is to provide the single best 5-letter English word as a guess.
 
@@ -38,6 +43,17 @@ class EnAgent(BaseAgent):
         """Returns a simple word for the agent."""
         return "ARISE"
 
+    @property
+    def fallback_words(self):
+        """Returns the local word list used while the API is unavailable."""
+        return [
+            "ARISE", "SLATE", "CRANE", "TOUCH", "MOUND", "BLIMP", "DWARF", "GUILD", "SHORT", "PLANT",
+            "CHOIR", "FUNKY", "BADGE", "EMPTY", "QUERY", "VIVID", "JOKER", "LEMON", "MAGIC", "NIGHT",
+            "OCEAN", "PIANO", "RIVER", "SUGAR", "TIGER", "UNCLE", "WATER", "YOUTH", "ZEBRA", "BRICK",
+            "CHALK", "FROST", "GLOVE", "HUMAN", "KNIFE", "LIGHT", "MONEY", "NORTH", "PRIZE", "QUICK",
+            "STORM", "TRAIN", "VOICE", "WHEAT", "YEAST", "DRINK", "SPOIL", "CLOUD", "GRAPE", "BOUND",
+        ]
+
     def _get_user_prompt(self, history):
         """Generates the user prompt for the AI based on the game history."""
         previous_guesses = [turn["guess"] for turn in history]
@@ -71,24 +87,23 @@ class EnAgent(BaseAgent):
 
     def get_ai_guess(self, history: list) -> str:
         """Generates a guess using the AI client based on the history of attempts."""
+        book_word = self._book_guess(history)
+        if book_word is not None:
+            return book_word
+
         user_prompt = self._get_user_prompt(history)
 
         messages = [{"role": "system", "content": self.system_prompt}, {"role": "user", "content": user_prompt}]
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.3,
-                max_tokens=4
-            )
-
-            ai_word = response.choices[0].message.content.strip().upper().replace(" ", "")
-            ai_word_sanitized = "".join([c for c in ai_word if c.isalpha()]).upper()
-            if len(ai_word_sanitized) > 5:
-                ai_word_sanitized = ai_word_sanitized[:5]
-
-            print(f"AI suggested: {ai_word_sanitized}")
-            return ai_word_sanitized
-        except Exception as e:
-            print(f"An error occurred with the OpenAI API: {e}")
-            return self.simple_word  # Fallback to a simple word if the API fails
+        content = self._complete(messages, temperature=self.temperature, priority=self._priority(history))
+        if content is None:
+            fallback_word = self.fallback_guess(history)
+            print(f"Using local fallback word: {fallback_word}")
+            return fallback_word
+
+        ai_word = content.strip().upper().replace(" ", "")
+        ai_word_sanitized = "".join([c for c in ai_word if c.isalpha()]).upper()
+        if len(ai_word_sanitized) > 5:
+            ai_word_sanitized = ai_word_sanitized[:5]
+
+        print(f"AI suggested: {ai_word_sanitized}")
+        return ai_word_sanitized
@@ -0,0 +1,141 @@
+"""
+Precomputed opening book per language.
+
+The first guess and the best second guess for every first-turn feedback only
+depend on the word lists, so they are computed offline once and stored on disk.
+Agents consult the book before calling the model, so the opening turns cost no
+network calls and never come back as a non-word.
+
+Build a book with:
+    python -m app.agents.opening_book --language en --answers answers.txt --guesses allowed.txt
+"""
+import argparse
+import json
+import os
+from collections import Counter, defaultdict
+from typing import Optional
+
+from ..words import feedback_to_int, int_to_feedback, load_words, score_guess, to_upper
+
+BOOKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "books")
+
+
+class OpeningBook:
+    """The best first guess and the best second guess for each first-turn feedback."""
+
+    def __init__(self, first: str, second: dict):
+        """
+        Args:
+            first (str): The first guess.
+            second (dict): Second guess per first-turn feedback string.
+        """
+        self.first = first
+        self.second = second
+
+    @staticmethod
+    def path_for(language: str) -> str:
+        """The default location of a language's book."""
+        return os.path.join(BOOKS_DIR, f"{language}.json")
+
+    @classmethod
+    def load(cls, language: str, path: str = None) -> Optional["OpeningBook"]:
+        """Loads a language's book, or returns None if it has not been built."""
+        path = path or cls.path_for(language)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        second = {int_to_feedback(int(key)): word for key, word in data["second"].items()}
+        return cls(data["first"], second)
+
+    def save(self, path: str):
+        """Writes the book to disk, keyed by base-3 feedback integers."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        data = {
+            "first": self.first,
+            "second": {str(key): word for key, word in sorted((feedback_to_int(f), w) for f, w in self.second.items())},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+    def lookup(self, history: list) -> Optional[str]:
+        """
+        Returns the book guess for the next turn, or None once the game is out of the book.
+
+        Words the site already rejected as invalid are never suggested again.
+        """
+        valid_turns = [turn for turn in history if turn["feedback"] != "INVALID"]
+        rejected = {turn["guess"] for turn in history if turn["feedback"] == "INVALID"}
+        if not valid_turns:
+            word = self.first
+        elif len(valid_turns) == 1 and valid_turns[0]["guess"] == self.first:
+            word = self.second.get(valid_turns[0]["feedback"])
+        else:
+            word = None
+        return None if word in rejected else word
+
+
+def best_guess(candidates: list, guesses: list) -> str:
+    """
+    Picks the guess that minimizes the expected number of remaining candidates.
+
+    Ties go to guesses that could themselves be the answer, then alphabetically.
+    """
+    candidate_set = set(candidates)
+    best_key, best_word = None, None
+    for guess in guesses:
+        buckets = Counter(score_guess(guess, answer) for answer in candidates)
+        key = (sum(count * count for count in buckets.values()), guess not in candidate_set, guess)
+        if best_key is None or key < best_key:
+            best_key, best_word = key, guess
+    return best_word
+
+
+def build_book(answers: list, guesses: list = None, first: str = None) -> OpeningBook:
+    """
+    Builds an opening book.
+
+    Args:
+        answers (list): The possible hidden answers.
+        guesses (list): Accepted guesses to search. Defaults to the answers.
+        first (str): Fixed first guess, skipping the (slowest) first-guess search.
+    """
+    guesses = guesses or answers
+    first = first or best_guess(answers, guesses)
+    print(f"First guess: {first}")
+
+    partitions = defaultdict(list)
+    for answer in answers:
+        partitions[score_guess(first, answer)].append(answer)
+
+    second = {}
+    for feedback, remaining in sorted(partitions.items()):
+        if feedback == "GGGGG":
+            continue
+        second[feedback] = remaining[0] if len(remaining) <= 2 else best_guess(remaining, guesses)
+    print(f"Second guesses computed for {len(second)} feedback patterns.")
+    return OpeningBook(first, second)
+
+
+def main():
+    """CLI entry point for building an opening book."""
+    parser = argparse.ArgumentParser(description="Build the opening book for a language")
+    parser.add_argument("--language", choices=["en", "tr"], required=True, help="Language of the word lists")
+    parser.add_argument("--answers", required=True, help="File with the possible answers, one per line")
+    parser.add_argument("--guesses", help="File with accepted guesses to search (default: the answers)")
+    parser.add_argument("--first", help="Use this first guess instead of searching for one")
+    parser.add_argument("--out", help="Output path (default: app/agents/books/<language>.json)")
+
+    args = parser.parse_args()
+    answers = load_words(args.answers, args.language)
+    guesses = load_words(args.guesses, args.language) if args.guesses else None
+    if guesses:
+        guesses = list(dict.fromkeys(guesses + answers))
+    book = build_book(answers, guesses, first=to_upper(args.first, args.language) if args.first else None)
+    path = args.out or OpeningBook.path_for(args.language)
+    book.save(path)
+    print(f"Opening book saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Request policy for the LLM calls made by the agents.
+
+Bounds the time spent per turn with a per-call deadline, hedges slow requests,
+retries rate-limited and server errors with exponential backoff, and stops
+calling a degraded API altogether through a circuit breaker.
+"""
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import openai
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures, then lets a single trial call through once the cooldown has passed."""
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0):
+        """
+        Args:
+            failure_threshold (int): Consecutive failed calls that open the circuit.
+            cooldown (float): Seconds the circuit stays open before a trial call is allowed.
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """One of "closed", "open" or "half_open"."""
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go to the API now.
+
+        While half-open, only the first caller is let through as the trial call; the others
+        are refused until its outcome is recorded.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        """Closes the circuit."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_skipped(self):
+        """Frees the trial call slot of a call that never reached the API, leaving the state as it is."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        """Counts a failed call, opening (or re-opening) the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    print(f"OpenAI API failed {self.failures} times in a row. Opening circuit for {self.cooldown:.0f}s.")
+                self.opened_at = time.monotonic()
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether the error is transient: rate limits, server errors, timeouts and connection errors."""
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError, TimeoutError)):
+        return True
+    return isinstance(error, openai.APIStatusError) and error.status_code >= 500
+
+
+def _retry_after(error: Exception) -> float:
+    """Seconds the server asked us to wait, if it said so."""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after", 0))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
+
+class RequestPolicy:
+    """Runs LLM requests with a deadline, hedging, backoff retries and a circuit breaker."""
+
+    def __init__(
+            self,
+            deadline: float = 20.0,
+            attempt_timeout: float = 8.0,
+            hedge_delay: float = 2.0,
+            hedge_percentile: float = 0.95,
+            min_samples: int = 10,
+            max_retries: int = 3,
+            backoff_base: float = 0.5,
+            backoff_max: float = 8.0,
+            breaker: CircuitBreaker = None
+    ):
+        """
+        Args:
+            deadline (float): Seconds a whole call may take, retries included.
+            attempt_timeout (float): Seconds a single attempt (with its hedge) may take.
+            hedge_delay (float): Seconds before hedging while there are too few latency samples.
+            hedge_percentile (float): Latency percentile after which a hedged request is fired.
+            min_samples (int): Latency samples needed before the percentile is used.
+            max_retries (int): Retries after the first attempt on transient errors.
+            backoff_base (float): First backoff delay in seconds, doubled on every retry.
+            backoff_max (float): Upper bound for a single backoff delay.
+            breaker (CircuitBreaker): Circuit breaker to use. Defaults to a new one.
+        """
+        self.deadline = deadline
+        self.attempt_timeout = attempt_timeout
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.latencies = deque(maxlen=100)
+        self._latencies_lock = threading.Lock()
+        # Sized for several concurrent games sharing the policy, each with a request and its hedge.
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-request")
+
+    def hedge_after(self) -> float:
+        """Seconds to wait on a request before firing a hedged duplicate."""
+        with self._latencies_lock:
+            samples = sorted(self.latencies)
+        if len(samples) < self.min_samples:
+            return self.hedge_delay
+        return samples[min(len(samples) - 1, int(len(samples) * self.hedge_percentile))]
+
+    def call(self, request, acquire=None):
+        """
+        Runs `request(timeout)` under the policy and returns its result.
+
+        `acquire(timeout)`, if given, is called before every attempt to wait for rate limit
+        budget, bounded by what is left of the deadline. The wait does not count against the
+        attempt's timeout, and its errors are raised as they are, without retries and without
+        counting as API failures. Hedged requests are only fired if budget is available at once.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            Exception: The error raised by `acquire`, or the last error if every attempt failed
+            or the deadline passed.
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError("OpenAI API circuit is open.")
+
+        deadline = time.monotonic() + self.deadline
+        last_error = TimeoutError(f"No response within {self.deadline:.0f}s.")
+        for attempt in range(self.max_retries + 1):
+            if acquire is not None:
+                try:
+                    acquire(max(0.0, deadline - time.monotonic()))
+                except Exception:
+                    self.breaker.record_skipped()
+                    raise
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                result = self._hedged(request, min(self.attempt_timeout, remaining), acquire)
+                self.breaker.record_success()
+                return result
+            except Exception as e:
+                last_error = e
+                if not is_retryable(e):
+                    break
+                delay = min(self.backoff_max, self.backoff_base * 2 ** attempt) * random.uniform(0.5, 1.0)
+                delay = max(delay, _retry_after(e))
+                if attempt == self.max_retries or time.monotonic() + delay >= deadline:
+                    break
+                print(f"OpenAI request failed ({e}). Retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+        self.breaker.record_failure()
+        raise last_error
+
+    def _hedged(self, request, timeout: float, acquire=None):
+        """Runs one attempt, firing a second identical request if the first is slower than usual."""
+        end = time.monotonic() + timeout
+        pending = {self._executor.submit(self._timed, request, timeout)}
+        done, pending = wait(pending, timeout=min(self.hedge_after(), timeout))
+        if pending and self._budget_now(acquire):
+            pending.add(self._executor.submit(self._timed, request, max(0.0, end - time.monotonic())))
+
+        error = None
+        while done or pending:
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+            if not pending:
+                break
+            done, pending = wait(pending, timeout=max(0.0, end - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                raise TimeoutError(f"No response within {timeout:.1f}s.")
+        raise error
+
+    @staticmethod
+    def _budget_now(acquire) -> bool:
+        """Whether budget for a hedged request is available without waiting."""
+        if acquire is None:
+            return True
+        try:
+            acquire(0.0)
+        except Exception:
+            return False
+        return True
+
+    def _timed(self, request, timeout: float):
+        """Runs the request and records its latency if it succeeds."""
+        start = time.monotonic()
+        result = request(timeout)
+        with self._latencies_lock:
+            self.latencies.append(time.monotonic() - start)
+        return result
+
+
+_policies = {}
+_policies_lock = threading.Lock()
+
+
+def get_request_policy(model: str) -> RequestPolicy:
+    """
+    Returns the process-wide request policy of a model.
+
+    Every game calling the model shares its circuit breaker, latency window (so hedging
+    follows the observed p95 rather than the fixed delay) and request threads.
+    """
+    with _policies_lock:
+        policy = _policies.get(model)
+        if policy is None:
+            policy = _policies[model] = RequestPolicy()
+        return policy
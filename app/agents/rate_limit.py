@@ -0,0 +1,227 @@
+"""
+Shared token-bucket rate limiting for LLM calls.
+
+All agents in a process acquire budget from one RateLimiter before calling the
+API, so concurrent games stay within the per-model requests-per-minute and
+tokens-per-minute quotas instead of bursting into 429s. Waiting calls are served
+by priority, so games closest to finishing get budget first. Budgets can be
+shared across processes by keeping the buckets in SQLite.
+
+Configuration (environment):
+    OPENAI_RATE_LIMITS     per-model limits, e.g. "gpt-4o-mini=500:200000,gpt-4o=500:30000"
+    OPENAI_RATE_LIMIT_DB   SQLite file to share the buckets across processes
+"""
+import heapq
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+# Requests and tokens per minute, used for models missing from OPENAI_RATE_LIMITS.
+DEFAULT_RATE_LIMITS = {
+    "gpt-4o-mini": {"requests": 500, "tokens": 200_000},
+    "gpt-4o": {"requests": 500, "tokens": 30_000},
+}
+
+
+def parse_rate_limits(spec: str) -> dict:
+    """Parses "model=rpm:tpm,..." into per-model limits."""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        model, _, values = item.partition("=")
+        rpm, _, tpm = values.partition(":")
+        limits[model.strip()] = {"requests": int(rpm), "tokens": int(tpm)}
+    return limits
+
+
+def estimate_tokens(messages: list, max_tokens: int) -> int:
+    """Roughly estimates the tokens a chat completion counts against the quota."""
+    prompt_chars = sum(len(message["content"]) for message in messages)
+    return prompt_chars // 4 + 4 * len(messages) + max_tokens
+
+
+def _take(buckets: dict, costs: dict, limits: dict, now: float) -> float:
+    """
+    Refills the buckets and consumes the costs if every bucket can pay them.
+
+    Each bucket holds up to one minute of quota and refills continuously.
+
+    Returns:
+        float: 0 if the budget was taken, otherwise the seconds until it will be available.
+    """
+    wait = 0.0
+    for kind, cost in costs.items():
+        capacity = limits[kind]
+        rate = capacity / 60.0
+        tokens, updated = buckets[kind]
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        buckets[kind] = [tokens, now]
+        cost = min(cost, capacity)
+        if tokens < cost:
+            wait = max(wait, (cost - tokens) / rate)
+
+    if wait == 0.0:
+        for kind, cost in costs.items():
+            buckets[kind][0] -= min(cost, limits[kind])
+    return wait
+
+
+class RateLimitTimeout(TimeoutError):
+    """Raised when a call waited longer than its timeout for rate limit budget, without reaching the API."""
+
+
+class LocalBucketStore:
+    """Keeps the buckets in memory, shared by every agent in the process."""
+
+    def __init__(self):
+        self._buckets = {}
+
+    def try_acquire(self, model: str, costs: dict, limits: dict) -> float:
+        """Takes the costs from the model's buckets, or returns the seconds to wait."""
+        now = time.time()
+        buckets = {kind: self._buckets.get((model, kind), [limits[kind], now]) for kind in costs}
+        wait = _take(buckets, costs, limits, now)
+        for kind, state in buckets.items():
+            self._buckets[(model, kind)] = state
+        return wait
+
+
+class SqliteBucketStore:
+    """Keeps the buckets in a SQLite file, shared by every process using it."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                    model TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    tokens REAL NOT NULL,
+                    updated REAL NOT NULL,
+                    PRIMARY KEY (model, kind)
+                )
+            ''')
+            conn.commit()
+
+    def try_acquire(self, model: str, costs: dict, limits: dict) -> float:
+        """Takes the costs from the model's buckets in one write transaction, or returns the seconds to wait."""
+        with closing(sqlite3.connect(self.path, timeout=30, isolation_level=None)) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                rows = dict(
+                    (kind, [tokens, updated]) for kind, tokens, updated in
+                    conn.execute("SELECT kind, tokens, updated FROM rate_limit_buckets WHERE model = ?", (model,))
+                )
+                buckets = {kind: rows.get(kind, [limits[kind], now]) for kind in costs}
+                wait = _take(buckets, costs, limits, now)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO rate_limit_buckets(model, kind, tokens, updated) VALUES (?, ?, ?, ?)",
+                    [(model, kind, tokens, updated) for kind, (tokens, updated) in buckets.items()]
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return wait
+
+
+class RateLimiter:
+    """Per-model token buckets with a priority queue of waiting calls."""
+
+    def __init__(self, limits: dict, store=None):
+        """
+        Args:
+            limits (dict): Per-model {"requests": rpm, "tokens": tpm}. Models without limits are not throttled.
+            store: Where the buckets live. Defaults to a LocalBucketStore.
+        """
+        self.limits = limits
+        self.store = store or LocalBucketStore()
+        self._cond = threading.Condition()
+        self._queues = {}
+        self._counter = itertools.count()
+        self._stats = {}
+
+    def acquire(self, model: str, tokens: int, priority: int = 0, timeout: float = None) -> float:
+        """
+        Blocks until one request and `tokens` tokens of the model's budget are available.
+
+        Args:
+            model (str): The model the call goes to.
+            tokens (int): Estimated tokens of the call.
+            priority (int): Higher priority calls are served first.
+            timeout (float): Seconds to wait at most.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        Raises:
+            RateLimitTimeout: If the budget did not become available within `timeout`.
+        """
+        limits = self.limits.get(model)
+        if not limits:
+            return 0.0
+
+        costs = {"requests": 1, "tokens": tokens}
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._cond:
+            queue = self._queues.setdefault(model, [])
+            entry = (-priority, next(self._counter))
+            heapq.heappush(queue, entry)
+            try:
+                while True:
+                    wait = None
+                    if queue[0] == entry:
+                        wait = self.store.try_acquire(model, costs, limits)
+                        if wait == 0.0:
+                            break
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise RateLimitTimeout(f"No {model} rate limit budget within {timeout:.1f}s.")
+                        wait = remaining if wait is None else min(wait, remaining)
+                    self._cond.wait(timeout=wait)
+            finally:
+                queue.remove(entry)
+                heapq.heapify(queue)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - start
+            stats = self._stats.setdefault(model, {"acquired": 0, "total_wait": 0.0, "max_wait": 0.0})
+            stats["acquired"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+        return waited
+
+    def stats(self) -> dict:
+        """Per-model acquired calls, queue wait times (seconds) and calls currently waiting."""
+        with self._cond:
+            summary = {}
+            for model in {**self._queues, **self._stats}:
+                stats = self._stats.get(model, {"acquired": 0, "total_wait": 0.0, "max_wait": 0.0})
+                summary[model] = {
+                    "acquired": stats["acquired"],
+                    "mean_wait": stats["total_wait"] / stats["acquired"] if stats["acquired"] else 0.0,
+                    "max_wait": stats["max_wait"],
+                    "waiting": len(self._queues.get(model, [])),
+                }
+            return summary
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Returns the process-wide rate limiter, configured from the environment on first use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            limits = {**DEFAULT_RATE_LIMITS, **parse_rate_limits(os.environ.get("OPENAI_RATE_LIMITS", ""))}
+            db_path = os.environ.get("OPENAI_RATE_LIMIT_DB")
+            store = SqliteBucketStore(db_path) if db_path else LocalBucketStore()
+            _rate_limiter = RateLimiter(limits, store)
+        return _rate_limiter
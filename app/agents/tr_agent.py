@@ -1,11 +1,16 @@
 from .base import BaseAgent
+from .opening_book import OpeningBook
 
 class TrAgent(BaseAgent):
     """TR Wordle Agent"""
 
-    def __init__(self, model: str = "gpt-4o-mini"):
-        super().__init__()
+    def __init__(self, model: str = "gpt-4o-mini", temperature: float = 0.2, seed: int = None, use_opening_book: bool = True):
+        super().__init__(model)
         self.model = model
+        self.temperature = temperature
+        self.seed = seed
+        if use_opening_book:
+            self.opening_book = OpeningBook.load("tr")
         self.system_prompt = """
         You are an expert Turkish Wordle solver. You will be given the game state and a list of rules. Your goal is to provide the single best 5-letter Turkish word as a guess.
         Here is an example of how to think:
@@ -43,6 +48,16 @@ class TrAgent(BaseAgent):
         """Returns a simple word for the agent."""
         return "SELAM"
 
+    @property
+    def fallback_words(self):
+        """Returns the local word list used while the API is unavailable."""
+        return [
+            "SELAM", "KALEM", "KİTAP", "MASAL", "ZAMAN", "İNSAN", "BİLGİ", "DÜNYA", "HAYAT", "SICAK",
+            "ŞEKER", "GÜNEŞ", "ÇİÇEK", "KAPAK", "KAVUN", "ARABA", "BALIK", "TAVUK", "ÇORBA", "DOLAP",
+            "SABUN", "SORUN", "KÖPEK", "ORMAN", "DENİZ", "BULUT", "ŞARKI", "TARLA", "KAYIK", "ELMAS",
+            "KUMAŞ", "KOLAY", "BEYAZ", "SİYAH", "YEŞİL", "ÖRDEK", "GÖZLÜ", "KÜREK", "FİDAN", "JETON",
+        ]
+
     def _get_user_prompt(self, history: list) -> str:
         """Generates the user prompt for the AI based on the game history."""
         previous_guesses = [turn["guess"] for turn in history]
@@ -77,22 +92,22 @@ class TrAgent(BaseAgent):
 
     def get_ai_guess(self, history: list) -> str:
         """Generates a guess using the AI client based on the history of attempts."""
+        book_word = self._book_guess(history)
+        if book_word is not None:
+            return book_word
+
         user_prompt = self._get_user_prompt(history)
         messages = [{"role": "system", "content": self.system_prompt}, {"role": "user", "content": user_prompt}]
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.2,
-                max_tokens=4
-            )
-            ai_word = response.choices[0].message.content.strip().replace(" ", "")
-            if len(ai_word) > 5:
-                ai_word = ai_word[:5]
-
-            print(f"AI suggested: {ai_word}")
-            return ai_word
-        except Exception as e:
-            print(f"An error occurred with the OpenAI API: {e}")
-            return self.simple_word  # Fallback to a simple word if the API fails
+        content = self._complete(messages, temperature=self.temperature, priority=self._priority(history))
+        if content is None:
+            fallback_word = self.fallback_guess(history)
+            print(f"Using local fallback word: {fallback_word}")
+            return fallback_word
+
+        ai_word = content.strip().replace(" ", "")
+        if len(ai_word) > 5:
+            ai_word = ai_word[:5]
+
+        print(f"AI suggested: {ai_word}")
+        return ai_word
@@ -2,11 +2,18 @@
 Optional API wrapper for the Wordle bot.
 This allows the bot to be used as a web service.
 """
+import json
+import queue
+import threading
 import time
 from pydantic import BaseModel
 
 from fastapi import FastAPI
-from .main import run_wordle_bot
+from fastapi.responses import StreamingResponse
+from .agents.rate_limit import get_rate_limiter
+from .db import Database
+from .export import EXPORT_DIR, export_results
+from .main import get_run_stats, run_wordle_bot
 
 # Create FastAPI app
 app = FastAPI(title="Wordle Bot API", description="AI-powered Wordle solver")
@@ -16,11 +23,54 @@ class RunPayload(BaseModel):
     language: str
     model: str = "gpt-4o-mini"
     save_to_db: bool = True
+    lean: bool = False
 
 @app.post("/run")
 def run_bot_api(payload: RunPayload):
-    """API endpoint to run the Wordle bot."""
-    return run_wordle_bot(payload.language, payload.model, payload.save_to_db)
+    """API endpoint to run the Wordle bot. Returns the stored result if today's game was already played."""
+    return run_wordle_bot(payload.language, payload.model, payload.save_to_db, lean=payload.lean)
+
+@app.post("/run/stream")
+def run_bot_stream_api(payload: RunPayload):
+    """
+    API endpoint to run the Wordle bot and stream its progress as Server-Sent Events.
+
+    Each game event is relayed as soon as it happens; the final result (or error)
+    is sent as a last `result` event before the stream closes.
+    """
+    events = queue.Queue()
+
+    def play():
+        try:
+            result = run_wordle_bot(payload.language, payload.model, payload.save_to_db, on_event=events.put, lean=payload.lean)
+        except Exception as e:
+            result = {"error": str(e)}
+        events.put({"type": "result", "timestamp": time.time(), **result})
+        events.put(None)
+
+    threading.Thread(target=play, daemon=True).start()
+
+    def event_stream():
+        while True:
+            event = events.get()
+            if event is None:
+                break
+            yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@app.post("/export")
+def export_api():
+    """API endpoint to append the results saved since the last export to the Parquet dataset in EXPORT_DIR."""
+    return export_results(Database(), EXPORT_DIR)
+
+@app.get("/stats")
+def stats_api():
+    """
+    Counts of requests served from the database, merged into an in-flight game, or played,
+    plus per-model rate limiter queue wait times.
+    """
+    return {**get_run_stats(), "rate_limiter": get_rate_limiter().stats()}
 
 @app.get("/health")
 def health_check():
@@ -17,7 +17,7 @@ class Database:
         self._init_db()
 
     def _init_db(self):
-        """Initializes the database connection and creates the results table."""
+        """Initializes the database connection and creates the results, checkpoints and tournament tables."""
         with sqlite3.connect(self.db_name) as conn:
             cursor = conn.cursor()
             cursor.execute('''
@@ -32,6 +32,30 @@ class Database:
                     PRIMARY KEY (run_date, language, model)
                 )
             ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    run_date TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    history TEXT NOT NULL,
+                    timestamp DATETIME NOT NULL,
+                    PRIMARY KEY (run_date, language, model)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tournament_results (
+                    tournament_id TEXT NOT NULL,
+                    strategy TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    seed INTEGER NOT NULL,
+                    answer TEXT NOT NULL,
+                    won BOOLEAN NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    history TEXT NOT NULL,
+                    timestamp DATETIME NOT NULL,
+                    PRIMARY KEY (tournament_id, strategy, seed)
+                )
+            ''')
             conn.commit()
         print("Database initialized successfully.")
 
@@ -68,8 +92,145 @@ class Database:
             conn.commit()
         print(f"Result for {language.upper()} Wordle saved to database.")
 
+    def get_result(self, run_date: str, language: str, model: str):
+        """
+        Fetches a single stored game result.
+
+        Args:
+            run_date (str): The date of the game run.
+            language (str): The language of the game.
+            model (str): The AI model used.
+
+        Returns:
+            dict: The result in the shape returned by `run_game` with `cached` set, or None if not played yet.
+        """
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT won, history, shareable_output FROM results
+                WHERE run_date = ? AND language = ? AND model = ?
+            ''', (run_date, language, model))
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+        won, history_json, shareable_output = row
+        history = json.loads(history_json)
+        return {
+            "won": bool(won),
+            "attempts": len([turn for turn in history if turn["feedback"] != "INVALID"]),
+            "history": history,
+            "result": shareable_output,
+            "cached": True,
+        }
+
+    def save_checkpoint(self, run_date: str, language: str, model: str, history: list):
+        """
+        Saves the history of an unfinished game, replacing any previous checkpoint.
+
+        Args:
+            run_date (str): The date of the game run.
+            language (str): The language of the game.
+            model (str): The AI model used.
+            history (list): The history of guesses and feedback so far.
+        """
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO
+                checkpoints(run_date, language, model, history, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (run_date, language, model, json.dumps(history), datetime.now()))
+            conn.commit()
+
+    def get_checkpoint(self, run_date: str, language: str, model: str):
+        """Fetches the history checkpointed for an unfinished game, or None if there is none."""
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT history FROM checkpoints
+                WHERE run_date = ? AND language = ? AND model = ?
+            ''', (run_date, language, model))
+            row = cursor.fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete_checkpoint(self, run_date: str, language: str, model: str):
+        """Deletes the checkpoint of a game once it is finished."""
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                DELETE FROM checkpoints
+                WHERE run_date = ? AND language = ? AND model = ?
+            ''', (run_date, language, model))
+            conn.commit()
+
     def get_all_results(self):
         """Fetches all game results from the database."""
         with sqlite3.connect(self.db_name) as conn:
             df = pd.read_sql_query("SELECT * FROM results", conn)
         return df
+
+    def get_results_after(self, row_id: int = None) -> list:
+        """
+        Fetches the game results inserted after the given row, in insert order.
+
+        Row ids are assigned under SQLite's write lock, so unlike timestamps (taken before
+        the insert waits for the lock) they never commit out of order.
+
+        Args:
+            row_id (int): Only results with a greater row id are returned. All results if None.
+
+        Returns:
+            list: One dict per result, with its `row_id` and the history decoded.
+        """
+        with sqlite3.connect(self.db_name) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT rowid AS row_id, * FROM results
+                WHERE rowid > ?
+                ORDER BY rowid
+            ''', (row_id or 0,))
+            rows = cursor.fetchall()
+        return [{**dict(row), "history": json.loads(row["history"])} for row in rows]
+
+    def save_tournament_result(
+            self,
+            tournament_id: str,
+            strategy: str,
+            language: str,
+            seed: int,
+            answer: str,
+            won: bool,
+            attempts: int,
+            history: list
+    ):
+        """
+        Saves a single offline tournament game to the database.
+
+        Args:
+            tournament_id (str): The tournament the game belongs to.
+            strategy (str): The name of the strategy that played.
+            language (str): The language of the game.
+            seed (int): The deterministic seed of the game.
+            answer (str): The hidden answer.
+            won (bool): Whether the game was won.
+            attempts (int): The number of attempts used.
+            history (list): The history of guesses and feedback.
+        """
+        with sqlite3.connect(self.db_name) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO
+                tournament_results(tournament_id, strategy, language, seed, answer, won, attempts, history, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (tournament_id, strategy, language, seed, answer, won, attempts, json.dumps(history), datetime.now()))
+            conn.commit()
+
+    def get_tournament_results(self, tournament_id: str):
+        """Fetches all games of a tournament from the database."""
+        with sqlite3.connect(self.db_name) as conn:
+            df = pd.read_sql_query(
+                "SELECT * FROM tournament_results WHERE tournament_id = ?", conn, params=(tournament_id,)
+            )
+        return df
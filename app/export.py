@@ -0,0 +1,160 @@
+"""
+Incremental columnar export of game results for analytics.
+
+Appends the games saved since the last export to Parquet files partitioned by
+language and month (`language=en/month=2025-01/part-....parquet`). The JSON
+history is flattened into typed columns, so queries only read the columns and
+partitions they need. Requires the optional `pyarrow` dependency.
+
+The dataset root defaults to the WORDLE_EXPORT_DIR environment variable, or
+`exports` if it is not set. The API always exports there.
+
+Usage:
+    python -m app.export --out exports
+"""
+import argparse
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+from .db import Database
+from .words import feedback_to_int
+
+EXPORT_DIR = os.environ.get("WORDLE_EXPORT_DIR", "exports")
+STATE_FILE = "_export_state.json"
+MAX_ATTEMPTS = 6
+
+# Serializes exports within a process, so concurrent triggers don't export the same games twice.
+_export_lock = threading.Lock()
+
+
+def _require_pyarrow():
+    """Imports pyarrow, which is only needed for exporting."""
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError as e:
+        raise ImportError("Exporting results requires pyarrow: pip install 'wordle-agent[export]'") from e
+    return pyarrow
+
+
+def export_schema(pa):
+    """The Arrow schema of the exported results."""
+    fields = [
+        ("run_date", pa.string()),
+        ("month", pa.string()),
+        ("language", pa.string()),
+        ("model", pa.string()),
+        ("won", pa.bool_()),
+        ("attempts", pa.int8()),
+        ("invalid_guesses", pa.int16()),
+    ]
+    for n in range(1, MAX_ATTEMPTS + 1):
+        fields.append((f"guess_{n}", pa.string()))
+        fields.append((f"feedback_{n}", pa.int16()))
+    fields.append(("timestamp", pa.timestamp("us")))
+    return pa.schema(fields)
+
+
+def flatten_result(row: dict) -> dict:
+    """
+    Flattens a stored result into one typed record.
+
+    Valid turns become `guess_<n>` and `feedback_<n>` columns, with feedback encoded as a
+    base-3 integer (B=0, Y=1, G=2, first letter most significant). Invalid guesses are counted.
+    """
+    valid_turns = [turn for turn in row["history"] if turn["feedback"] != "INVALID"]
+    record = {
+        "run_date": row["run_date"],
+        "month": row["run_date"][:7],
+        "language": row["language"],
+        "model": row["model"],
+        "won": bool(row["won"]),
+        "attempts": len(valid_turns),
+        "invalid_guesses": len(row["history"]) - len(valid_turns),
+        "timestamp": datetime.fromisoformat(row["timestamp"]),
+    }
+    for n in range(1, MAX_ATTEMPTS + 1):
+        turn = valid_turns[n - 1] if n <= len(valid_turns) else None
+        record[f"guess_{n}"] = turn["guess"] if turn else None
+        record[f"feedback_{n}"] = feedback_to_int(turn["feedback"]) if turn else None
+    return record
+
+
+def _read_state(out_dir: str) -> dict:
+    """Reads the export state, which records the row id of the last exported result."""
+    path = os.path.join(out_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {"last_row_id": None}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_state(out_dir: str, state: dict):
+    """Writes the export state atomically."""
+    path = os.path.join(out_dir, STATE_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(path + ".tmp", path)
+
+
+def export_results(db: Database, out_dir: str = EXPORT_DIR) -> dict:
+    """
+    Appends the results saved since the last export to the partitioned Parquet dataset.
+
+    Args:
+        db (Database): The database to export from.
+        out_dir (str): The root directory of the dataset.
+
+    Returns:
+        dict: The number of exported games, the files written and the row id of the last exported result.
+    """
+    pa = _require_pyarrow()
+    with _export_lock:
+        return _export_new_results(pa, db, out_dir)
+
+
+def _export_new_results(pa, db: Database, out_dir: str) -> dict:
+    """Writes the results saved since the last export and advances the export state."""
+    os.makedirs(out_dir, exist_ok=True)
+    state = _read_state(out_dir)
+    rows = db.get_results_after(state["last_row_id"])
+    if not rows:
+        print("No new results to export.")
+        return {"exported": 0, "files": [], "last_row_id": state["last_row_id"]}
+
+    schema = export_schema(pa)
+    table = pa.Table.from_pylist([flatten_result(row) for row in rows], schema=schema)
+    written = []
+    pa.dataset.write_dataset(
+        table,
+        out_dir,
+        format="parquet",
+        partitioning=pa.dataset.partitioning(
+            pa.schema([schema.field("language"), schema.field("month")]), flavor="hive"
+        ),
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_visitor=lambda written_file: written.append(written_file.path),
+    )
+
+    state["last_row_id"] = rows[-1]["row_id"]
+    _write_state(out_dir, state)
+    print(f"Exported {len(rows)} result(s) to {len(written)} file(s) under {out_dir}.")
+    return {"exported": len(rows), "files": written, "last_row_id": state["last_row_id"]}
+
+
+def main():
+    """CLI entry point for the results exporter."""
+    parser = argparse.ArgumentParser(description="Export new game results to partitioned Parquet files")
+    parser.add_argument("--db", default="wordle.db", help="SQLite database to export from")
+    parser.add_argument("--out", default=EXPORT_DIR, help="Root directory of the Parquet dataset (default: $WORDLE_EXPORT_DIR or exports)")
+
+    args = parser.parse_args()
+    export_results(Database(args.db), args.out)
+
+
+if __name__ == "__main__":
+    main()
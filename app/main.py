@@ -6,6 +6,11 @@ import time
 import argparse
 import sys
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException
+from urllib3.exceptions import HTTPError as DriverConnectionError
 
 # Add the parent directory to sys.path for imports when run directly
 if __name__ == "__main__":
@@ -15,6 +20,7 @@ try:
     # Try relative imports first (when imported as module)
     from .navigator.tr_navigator import TrNavigator
     from .navigator.en_navigator import EnNavigator
+    from .navigator.base import SharedBrowser
     from .agents.tr_agent import TrAgent
     from .agents.en_agent import EnAgent
     from .db import Database
@@ -23,52 +29,225 @@ except ImportError:
     # Fall back to absolute imports (when run directly)
     from app.navigator.tr_navigator import TrNavigator
     from app.navigator.en_navigator import EnNavigator
+    from app.navigator.base import SharedBrowser
     from app.agents.tr_agent import TrAgent
     from app.agents.en_agent import EnAgent
     from app.db import Database
     from app.run import run_game
 
-def run_wordle_bot(language: str, model: str = "gpt-4o-mini", save_to_db: bool = True):
-    """Main function to run the Wordle bot."""
-    if language == "en":
-        url = "https://www.nytimes.com/games/wordle/index.html"
-        navigator = EnNavigator(url=url)
-        agent = EnAgent(model=model)
-    elif language == "tr":
-        url = "https://wordleturkce.bundle.app/"
-        navigator = TrNavigator(url=url)
-        agent = TrAgent(model=model)
-    else:
+# How many times a game is resumed in a fresh browser after the driver dies.
+MAX_BROWSER_RESTARTS = 2
+
+# Counters for requests answered from the database, merged into an in-flight game, or actually played.
+RUN_STATS = {"cache_hits": 0, "deduplicated": 0, "games_played": 0}
+_run_lock = threading.Lock()
+# In-flight games: key -> (Future of the result, event listeners of every merged request).
+_in_flight = {}
+
+def _is_browser_lost(error: Exception) -> bool:
+    """
+    Whether the error means the browser session itself is gone (Firefox or geckodriver died),
+    as opposed to a page element that was missing, stale or slow to appear.
+    """
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError, DriverConnectionError)):
+        return True
+    # Firefox crashing under a live geckodriver surfaces as a generic WebDriverException.
+    message = str(error).lower()
+    return isinstance(error, WebDriverException) and (
+        "marionette" in message or "without establishing a connection" in message
+    )
+
+def get_run_stats() -> dict:
+    """Returns a snapshot of the run counters."""
+    with _run_lock:
+        return dict(RUN_STATS)
+
+def run_wordle_bot(
+        language: str,
+        model: str = "gpt-4o-mini",
+        save_to_db: bool = True,
+        on_event=None,
+        lean: bool = False,
+        browser: SharedBrowser = None
+):
+    """Main function to run the Wordle bot.
+
+    Each (day, language, model) is played at most once: a result already stored in the
+    database is returned immediately, and concurrent identical requests (with the same
+    `save_to_db`) share a single in-flight game.
+
+    `on_event`, if given, is called with each progress event emitted by `run_game`, also when
+    the request is merged into a game already in flight (from the moment it joins).
+    `lean` starts the browser with images, media, telemetry and third-party trackers blocked.
+    `browser`, if given, plays the game in a new window of that shared browser.
+    """
+    if language not in ("en", "tr"):
         raise ValueError(f"Unsupported language: {language}")
 
-    try:
-        result = run_game(navigator, agent)
-
-        if save_to_db:
-            db = Database()
-            db.save_result(
-                run_date=time.strftime("%Y-%m-%d"),
-                language=language,
-                model=model,
-                won=result["won"],
-                history=result["history"],
-                shareable_output=result["result"]
-            )
+    run_date = time.strftime("%Y-%m-%d")
+    stored = _get_stored_result(run_date, language, model) if save_to_db else None
+    if stored is not None:
+        return stored
+
+    # Games that are not saved must not answer requests that expect a stored result, so they don't merge.
+    key = (run_date, language, model, save_to_db)
+    with _run_lock:
+        entry = _in_flight.get(key)
+        is_leader = entry is None
+        if is_leader:
+            entry = _in_flight[key] = (Future(), [])
+        else:
+            RUN_STATS["deduplicated"] += 1
+        future, listeners = entry
+        if on_event is not None:
+            listeners.append(on_event)
+
+    if not is_leader:
+        print(f"{language.upper()} Wordle for {run_date} is already being played with {model}. Waiting for its result.")
+        return future.result()
 
+    try:
+        # A previous leader may have saved its result and left between the check above and taking the lead.
+        result = _get_stored_result(run_date, language, model) if save_to_db else None
+        if result is None:
+            result = _play_wordle(language, model, save_to_db, run_date, _broadcast(listeners), lean, browser)
+        future.set_result(result)
         return result
-    except Exception as e:
-        print(f"Error running bot: {e}")
-        return {"error": str(e)}
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _run_lock:
+            del _in_flight[key]
+
+def _broadcast(listeners: list):
+    """Returns an event listener relaying each event to every request merged into the game."""
+    def on_event(event: dict):
+        with _run_lock:
+            targets = list(listeners)
+        for listener in targets:
+            try:
+                listener(event)
+            except Exception as e:
+                print(f"Event listener failed on '{event['type']}': {e}")
+    return on_event
+
+def _get_stored_result(run_date, language, model):
+    """Returns the stored result of a game already played, counting it as a cache hit, or None."""
+    stored = Database().get_result(run_date, language, model)
+    if stored is not None:
+        print(f"{language.upper()} Wordle for {run_date} was already played with {model}. Returning stored result.")
+        with _run_lock:
+            RUN_STATS["cache_hits"] += 1
+    return stored
+
+def _play_wordle(language, model, save_to_db, run_date, on_event, lean, browser):
+    """
+    Plays one game and stores its result.
+
+    The history is checkpointed after every turn (to the database when `save_to_db`).
+    If the browser session is lost mid-game, a fresh navigator is started and the game resumes
+    from the last completed attempt, up to MAX_BROWSER_RESTARTS times. A checkpoint
+    left by an earlier crashed run is resumed the same way.
+    """
+    with _run_lock:
+        RUN_STATS["games_played"] += 1
+
+    db = Database() if save_to_db else None
+    history = (db.get_checkpoint(run_date, language, model) if db else None) or []
+    if history:
+        print(f"Found a checkpoint with {len(history)} turn(s) for {language.upper()} Wordle.")
+
+    def save_checkpoint(turns: list):
+        history[:] = turns
+        if db:
+            db.save_checkpoint(run_date, language, model, turns)
+
+    agent = EnAgent(model=model) if language == "en" else TrAgent(model=model)
+    for restart in range(MAX_BROWSER_RESTARTS + 1):
+        navigator = None
+        try:
+            # After a crash the shared browser may be gone too, so restarts get their own driver.
+            game_browser = browser if restart == 0 else None
+            if language == "en":
+                url = "https://www.nytimes.com/games/wordle/index.html"
+                navigator = EnNavigator(url=url, lean=lean, browser=game_browser)
+            else:
+                url = "https://wordleturkce.bundle.app/"
+                navigator = TrNavigator(url=url, lean=lean, browser=game_browser)
+
+            result = run_game(navigator, agent, on_event=on_event, history=history, on_checkpoint=save_checkpoint)
+
+            if save_to_db:
+                db.save_result(
+                    run_date=run_date,
+                    language=language,
+                    model=model,
+                    won=result["won"],
+                    history=result["history"],
+                    shareable_output=result["result"]
+                )
+                db.delete_checkpoint(run_date, language, model)
+
+            return result
+        except Exception as e:
+            if not _is_browser_lost(e):
+                print(f"Error running bot: {e}")
+                return {"error": str(e)}
+            print(f"Browser failed: {e}")
+            if navigator is not None:
+                try:
+                    navigator.close_browser()
+                except Exception:
+                    pass
+            if restart == MAX_BROWSER_RESTARTS:
+                return {"error": str(e)}
+            completed = len([turn for turn in history if turn["feedback"] != "INVALID"])
+            print(f"Restarting the browser and resuming from turn {completed + 1}...")
+
+def run_wordle_bots(
+        languages: list,
+        model: str = "gpt-4o-mini",
+        save_to_db: bool = True,
+        lean: bool = False,
+        shared_browser: bool = True
+):
+    """
+    Runs several games concurrently, one thread per language.
+
+    With `shared_browser`, all games run as windows of a single Firefox process
+    instead of one process per game.
+
+    Returns:
+        dict: Game result per language.
+    """
+    browser = SharedBrowser(lean=lean) if shared_browser else None
+    try:
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            futures = {
+                language: executor.submit(run_wordle_bot, language, model, save_to_db, lean=lean, browser=browser)
+                for language in languages
+            }
+            return {language: future.result() for language, future in futures.items()}
+    finally:
+        if browser is not None:
+            browser.quit()
 
 def main():
     """CLI entry point for the Wordle bot."""
     parser = argparse.ArgumentParser(description="Run the AI Wordle Bot")
-    parser.add_argument("language", choices=["en", "tr"], help="Language to play (en/tr)")
+    parser.add_argument("language", nargs="+", choices=["en", "tr"], help="Language(s) to play (en/tr); several run concurrently")
     parser.add_argument("--model", default="gpt-4o-mini", help="AI model to use")
     parser.add_argument("--no-db", action="store_true", help="Don't save results to database")
+    parser.add_argument("--lean", action="store_true", help="Block images, media, telemetry and third-party trackers")
+    parser.add_argument("--separate-browsers", action="store_true", help="Use one Firefox process per game instead of one shared browser")
 
     args = parser.parse_args()
-    run_wordle_bot(args.language, args.model, save_to_db=not args.no_db)
+    languages = list(dict.fromkeys(args.language))
+    if len(languages) == 1:
+        run_wordle_bot(languages[0], args.model, save_to_db=not args.no_db, lean=args.lean)
+    else:
+        run_wordle_bots(languages, args.model, save_to_db=not args.no_db, lean=args.lean, shared_browser=not args.separate_browsers)
 
 if __name__ == "__main__":
     main()
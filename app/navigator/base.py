@@ -1,24 +1,286 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import quote
+
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.firefox.options import Options
 
 GECKODRIVER_PATH = "./geckodriver"
 
+# Firefox preferences applied in lean mode: no images, no autoplay, no telemetry, no animations.
+LEAN_FIREFOX_PREFS = {
+    "permissions.default.image": 2,
+    "media.autoplay.default": 5,
+    "media.autoplay.blocking_policy": 2,
+    "ui.prefersReducedMotion": 1,
+    "image.animation_mode": "none",
+    "toolkit.cosmeticAnimations.enabled": False,
+    "browser.cache.disk.enable": False,
+    "dom.webnotifications.enabled": False,
+    "geo.enabled": False,
+    "toolkit.telemetry.enabled": False,
+    "toolkit.telemetry.unified": False,
+    "toolkit.telemetry.archive.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "app.shield.optoutstudies.enabled": False,
+    "app.normandy.enabled": False,
+    "browser.ping-centre.telemetry": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+}
+
+# Third-party hosts (ads, analytics, tracking) that the games do not need to be playable.
+BLOCKED_HOSTS = [
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adsrvr.org",
+    "criteo.com",
+    "chartbeat.com",
+    "chartbeat.net",
+    "scorecardresearch.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "bat.bing.com",
+    "hotjar.com",
+    "newrelic.com",
+    "nr-data.net",
+    "sentry.io",
+    "brandmetrics.com",
+    "permutive.com",
+    "cdn.cookielaw.org",
+]
+
+
+def build_blocklist_pac(blocked_hosts: list) -> str:
+    """
+    Builds a proxy auto-config script that blackholes the given hosts.
+
+    Firefox has no URL blocklist preference, so requests to blocked hosts (and their
+    subdomains) are routed to an unreachable proxy while everything else goes direct.
+    """
+    return (
+        "function FindProxyForURL(url, host) {\n"
+        f"  var blocked = {json.dumps(sorted(set(blocked_hosts)))};\n"
+        "  for (var i = 0; i < blocked.length; i++) {\n"
+        "    if (host === blocked[i] || dnsDomainIs(host, '.' + blocked[i])) {\n"
+        "      return 'PROXY 127.0.0.1:9';\n"
+        "    }\n"
+        "  }\n"
+        "  return 'DIRECT';\n"
+        "}\n"
+    )
+
+
+def create_driver(lean: bool = False, blocked_hosts: list = None):
+    """
+    Starts a headless Firefox driver.
+
+    Args:
+        lean (bool): Whether to apply the resource-blocking lightweight profile.
+        blocked_hosts (list): Hosts to block in lean mode. Defaults to BLOCKED_HOSTS.
+    """
+    blocked_hosts = BLOCKED_HOSTS if blocked_hosts is None else blocked_hosts
+    print("Setting up Firefox driver...")
+    firefox_options = Options()
+    firefox_options.add_argument("--headless")
+    if lean:
+        print("Using lean browser profile.")
+        for name, value in LEAN_FIREFOX_PREFS.items():
+            firefox_options.set_preference(name, value)
+        if blocked_hosts:
+            pac = build_blocklist_pac(blocked_hosts)
+            firefox_options.set_preference("network.proxy.type", 2)
+            firefox_options.set_preference("network.proxy.allow_hijacking_localhost", True)
+            firefox_options.set_preference("network.proxy.autoconfig_url", "data:text/javascript," + quote(pac))
+    service = Service(executable_path=GECKODRIVER_PATH)
+    driver = webdriver.Firefox(service=service, options=firefox_options)
+    driver.set_page_load_timeout(30)
+    return driver
+
+
+class SharedBrowser:
+    """
+    A single Firefox driver hosting several games, each in its own window.
+
+    WebDriver talks to one window at a time, so navigators take `lock` and switch
+    to their window before acting (see `BaseNavigator.active`). While one game is
+    loading, waiting on an animation or on the LLM, it releases the lock (see
+    `BaseNavigator.pause`) and the others can use the driver.
+    """
+
+    def __init__(self, lean: bool = False, blocked_hosts: list = None):
+        """Starts the shared Firefox driver."""
+        self.driver = create_driver(lean=lean, blocked_hosts=blocked_hosts)
+        self.lock = threading.RLock()
+        self._blank_handle = self.driver.current_window_handle
+        self._focused_handle = self._blank_handle
+        self._handles = []
+
+    def open_window(self) -> str:
+        """Opens a window for a new game, focuses it and returns its handle."""
+        with self.lock:
+            if self._blank_handle is not None:
+                handle, self._blank_handle = self._blank_handle, None
+            else:
+                self.driver.switch_to.new_window("window")
+                handle = self.driver.current_window_handle
+            self._handles.append(handle)
+            self._focused_handle = handle
+            return handle
+
+    def focus(self, handle: str):
+        """Switches the driver to the given window, if it is not already there."""
+        with self.lock:
+            if handle != self._focused_handle:
+                self.driver.switch_to.window(handle)
+                self._focused_handle = handle
+
+    def close_window(self, handle: str):
+        """Closes a game's window. The last window is blanked instead, as closing it ends the session."""
+        with self.lock:
+            self.focus(handle)
+            self._handles.remove(handle)
+            if self._handles or self._blank_handle is not None:
+                self.driver.close()
+                self._focused_handle = None
+            else:
+                self.driver.get("about:blank")
+                self._blank_handle = handle
+
+    def quit(self):
+        """Quits the shared driver and every window in it."""
+        with self.lock:
+            self.driver.quit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.quit()
+
+
 class BaseNavigator:
-    def __init__(self, url: str):
-        """Initializes the BaseNavigator with a Firefox driver."""
+    # Seconds to wait after submitting a guess for the tiles to finish animating.
+    settle_delay = 5
+
+    def __init__(self, url: str, lean: bool = False, blocked_hosts: list = None, browser: SharedBrowser = None):
+        """
+        Initializes the BaseNavigator with a Firefox driver.
+
+        Args:
+            url (str): The URL of the game.
+            lean (bool): Whether to start a resource-blocking lightweight browser profile.
+            blocked_hosts (list): Hosts to block in lean mode. Defaults to BLOCKED_HOSTS.
+            browser (SharedBrowser): Shared driver to open the game in, instead of starting a new one.
+        """
         self.url = url
-        self.setup()
+        self.lean = lean
+        self.blocked_hosts = BLOCKED_HOSTS if blocked_hosts is None else blocked_hosts
+        self.browser = browser
+        self.window_handle = None
+        self.timings = {}
+        self._lock_depth = 0
+        with self.active():
+            self.setup()
+
+    @contextmanager
+    def active(self):
+        """
+        Gives the caller exclusive use of this navigator's window on a shared browser.
+        A no-op for navigators that own their driver.
+        """
+        if self.browser is None:
+            yield
+            return
+        with self.browser.lock:
+            self._lock_depth += 1
+            try:
+                if self.window_handle is not None:
+                    self.browser.focus(self.window_handle)
+                yield
+            finally:
+                self._lock_depth -= 1
+
+    def pause(self, seconds: float):
+        """
+        Sleeps without holding the shared browser, so other games can use the driver meanwhile.
+        The window is focused again before returning.
+        """
+        if self.browser is None or not self._lock_depth:
+            time.sleep(seconds)
+            return
+        depth = self._lock_depth
+        for _ in range(depth):
+            self.browser.lock.release()
+        try:
+            time.sleep(seconds)
+        finally:
+            for _ in range(depth):
+                self.browser.lock.acquire()
+            if self.window_handle is not None:
+                self.browser.focus(self.window_handle)
+
+    def wait_until(self, condition, timeout: float, target=None, poll: float = 0.5):
+        """
+        Polls `condition(target)` until it returns a truthy value, like `WebDriverWait.until`,
+        but pausing between polls so the shared browser is free in the meantime.
+
+        Args:
+            condition: An expected condition, called with the target.
+            timeout (float): Seconds to wait at most.
+            target: The driver, element or shadow root to search. Defaults to the driver.
+            poll (float): Seconds between polls.
+
+        Raises:
+            TimeoutException: If the condition did not hold within `timeout`.
+        """
+        target = self.driver if target is None else target
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = condition(target)
+                if value:
+                    return value
+            except NoSuchElementException:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Condition not met within {timeout}s.")
+            self.pause(poll)
+
+    def load_page(self, url: str, timeout: float = 30):
+        """
+        Opens the URL in this navigator's window.
+
+        On a shared browser the navigation is started from a script and polled for,
+        instead of blocking the driver for the whole page load with `driver.get`.
+        """
+        if self.browser is None:
+            self.driver.get(url)
+            return
+        self.driver.execute_script("window.location.assign(arguments[0]);", url)
+        self.wait_until(
+            lambda driver: driver.execute_script(
+                'return window.location.href !== "about:blank" && document.readyState === "complete";'
+            ),
+            timeout,
+            poll=0.2,
+        )
 
     def setup_driver(self):
         """Sets up the Firefox driver for Selenium."""
-        print("Setting up Firefox driver...")
-        firefox_options = Options()
-        firefox_options.add_argument("--headless")
-        service = Service(executable_path=GECKODRIVER_PATH)
-        driver = webdriver.Firefox(service=service, options=firefox_options)
-        driver.set_page_load_timeout(30)
-        return driver
+        return create_driver(lean=self.lean, blocked_hosts=self.blocked_hosts)
 
     def get_keyboard_container(self):
         """Finds the keyboard container for the current game."""
@@ -36,13 +298,42 @@ class BaseNavigator:
         """Reads the result (colors) from a specific row after a guess."""
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def read_board(self) -> list:
+        """Reads back the evaluated rows already on the board, as history entries."""
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    @staticmethod
+    def _history_from_tiles(rows: list, to_upper=str.upper) -> list:
+        """
+        Converts rows of (letter, state) tile pairs into history entries.
+
+        Reading stops at the first row that is not fully evaluated.
+        """
+        states = {"correct": "G", "present": "Y", "absent": "B"}
+        history = []
+        for row in rows:
+            if len(row) != 5 or any(state not in states for _, state in row):
+                break
+            history.append({
+                "guess": "".join(to_upper(letter or "") for letter, _ in row),
+                "feedback": "".join(states[state] for _, state in row),
+            })
+        return history
+
     def setup(self):
         """Sets up the navigator."""
-        self.driver = self.setup_driver()
+        if self.browser is not None:
+            self.driver = self.browser.driver
+            self.window_handle = self.browser.open_window()
+        else:
+            self.driver = self.setup_driver()
 
     def close_browser(self):
-        """Closes the browser."""
-        self.driver.quit()
+        """Closes the browser, or only this game's window on a shared browser."""
+        if self.browser is not None:
+            self.browser.close_window(self.window_handle)
+        else:
+            self.driver.quit()
 
     @staticmethod
     def _get_shareable_output(history: list) -> str:
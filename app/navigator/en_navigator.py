@@ -1,21 +1,20 @@
 import time
 
-from .base import BaseNavigator
+from .base import BaseNavigator, SharedBrowser
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 class EnNavigator(BaseNavigator):
-    def __init__(self, url: str):
+    def __init__(self, url: str, lean: bool = False, blocked_hosts: list = None, browser: SharedBrowser = None):
         """Initializes the EnNavigator with a Firefox driver."""
-        super().__init__(url=url)
+        super().__init__(url=url, lean=lean, blocked_hosts=blocked_hosts, browser=browser)
 
     def get_keyboard_container(self):
         """Finds the keyboard container for English Wordle."""
-        return WebDriverWait(self.driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'div[class^="Keyboard-module_keyboard"]'))
+        return self.wait_until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, 'div[class^="Keyboard-module_keyboard"]')), 15
         )
 
     def type_word(self, word_to_type: str):
@@ -26,7 +25,7 @@ class EnNavigator(BaseNavigator):
         for letter in word_to_type:
             key_element = keyboard_container.find_element(By.CSS_SELECTOR, f"button[data-key='{letter.lower()}']")
             key_element.click()
-            time.sleep(0.4) 
+            self.pause(0.4) 
 
         enter_key = keyboard_container.find_element(By.CSS_SELECTOR, "button[data-key='↵']")
         enter_key.click()
@@ -39,7 +38,7 @@ class EnNavigator(BaseNavigator):
         backspace_key = keyboard_container.find_element(By.CSS_SELECTOR, "button[data-key='←']")
         for _ in range(length):
             backspace_key.click()
-            time.sleep(0.05)
+            self.pause(0.05)
 
     def read_result(self, attempt_index: int) -> str:
         """Reads the result (colors) from a specific row after a guess."""
@@ -48,8 +47,8 @@ class EnNavigator(BaseNavigator):
         tiles = []
         try:
             # 1. Find the main game container
-            game_container = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, 'wordle-app-game'))
+            game_container = self.wait_until(
+                EC.presence_of_element_located((By.ID, 'wordle-app-game')), 10
             )
 
             # 2. Find the board element within the game container
@@ -86,23 +85,39 @@ class EnNavigator(BaseNavigator):
         print(f"Result found: {result}")
         return result
 
+    def read_board(self) -> list:
+        """Reads back the evaluated rows already on the board in a single script call."""
+        rows = self.driver.execute_script("""
+            const board = document.querySelector('#wordle-app-game div[class^="Board-module_board"]');
+            if (!board) {
+                return [];
+            }
+            return Array.from(board.querySelectorAll('div[class^="Row-module_row"]')).map((row) =>
+                Array.from(row.querySelectorAll('div[data-testid="tile"]')).map((tile) =>
+                    [tile.textContent.trim(), tile.getAttribute("data-state")]
+                )
+            );
+        """)
+        return self._history_from_tiles(rows)
+
     def read_final_result(self, history: list) -> str:
         """reads the final result of the game."""
         try:
-            time.sleep(1)  # Wait for the game to finish processing
-            first_close_button = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'button[class^="Modal-module_closeIconButton"]'))
+            self.pause(1)  # Wait for the game to finish processing
+            first_close_button = self.wait_until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'button[class^="Modal-module_closeIconButton"]')), 5
             )
             if first_close_button:
                 first_close_button.click()
 
-            time.sleep(1)  # Wait for the modal to close
-            button = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'button[class^="Footer-module_shareButton"]'))
+            self.pause(1)  # Wait for the modal to close
+            button = self.wait_until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'button[class^="Footer-module_shareButton"]')), 5
             )
             if button:
                 button.click()
 
+            # Keep the shared browser until the clipboard is read: other windows share the clipboard.
             time.sleep(1)  # Wait for the share modal to open
             try:
                 return self.driver.execute_script("return navigator.clipboard.readText();")
@@ -117,31 +132,34 @@ class EnNavigator(BaseNavigator):
         """Sets up the navigator."""
         print("Setting up the EnNavigator...")
         super().setup()
-        self.driver.get(self.url)
+        start = time.perf_counter()
+        self.load_page(self.url)
+        self.timings["page_load"] = time.perf_counter() - start
 
         # entering with the play button
         try:
-            play_button = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="Play"]')))
+            play_button = self.wait_until(EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="Play"]')), 10)
             print("Found initial 'Play' button. Clicking it.")
             play_button.click()
-            time.sleep(1)
+            self.pause(1)
         except TimeoutException:
             print("'Play' button not found, assuming we are already on the game screen.")
 
         # Close pop-up
         try:
-            close_button = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="icon-close"]')))
+            close_button = self.wait_until(EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-testid="icon-close"]')), 10)
             print("Closing the help pop-up.")
             close_button.click()
-            time.sleep(1)
+            self.pause(1)
         except TimeoutException:
             print("Help pop-up not found or already closed.")
 
         self.get_keyboard_container()
+        self.timings["time_to_keyboard"] = time.perf_counter() - start
         print("Game keyboard loaded.")
 
         # Wake-up keystroke is always a good idea
         self.type_word("A")
-        time.sleep(0.5)
+        self.pause(0.5)
         self.clear_word(1)
-        time.sleep(0.5)
+        self.pause(0.5)
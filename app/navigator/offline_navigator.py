@@ -0,0 +1,62 @@
+from .base import BaseNavigator
+from ..words import score_guess, to_upper
+
+class OfflineNavigator(BaseNavigator):
+    """Plays against a known answer without a browser, for offline evaluation of strategies."""
+
+    # No animations to wait for.
+    settle_delay = 0
+
+    def __init__(self, answer: str, language: str = "en", valid_words: list = None):
+        """
+        Initializes the OfflineNavigator.
+
+        Args:
+            answer (str): The hidden answer.
+            language (str): The language of the game, used to normalize guesses.
+            valid_words (list): Accepted guesses. If not given, any 5-letter word is accepted.
+        """
+        self.language = language
+        self.answer = to_upper(answer, language)
+        self.valid_words = set(valid_words) if valid_words else None
+        super().__init__(url=f"offline:{language}")
+
+    def setup(self):
+        """Sets up the navigator."""
+        self.driver = None
+        self.rows = []
+        self.typed = ""
+
+    def get_keyboard_container(self):
+        """There is no keyboard offline."""
+        return None
+
+    def type_word(self, word_to_type: str):
+        """Records the typed word."""
+        self.typed = to_upper(word_to_type, self.language)
+
+    def clear_word(self, length: int):
+        """Clears the typed word."""
+        self.typed = ""
+
+    def read_result(self, attempt_index: int) -> str:
+        """Scores the typed word, or returns INVALID if it is not an accepted guess."""
+        guess, self.typed = self.typed, ""
+        if len(guess) != 5 or not guess.isalpha():
+            return "INVALID"
+        if self.valid_words is not None and guess not in self.valid_words and guess != self.answer:
+            return "INVALID"
+        feedback = score_guess(guess, self.answer)
+        self.rows.append({"guess": guess, "feedback": feedback})
+        return feedback
+
+    def read_board(self) -> list:
+        """Returns the rows played so far."""
+        return list(self.rows)
+
+    def read_final_result(self, history: list) -> str:
+        """Builds the shareable output from the history."""
+        return self._get_shareable_output(history)
+
+    def close_browser(self):
+        """There is no browser to close."""
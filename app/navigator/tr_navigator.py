@@ -1,16 +1,15 @@
 import time
 
-from .base import BaseNavigator
+from .base import BaseNavigator, SharedBrowser
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 class TrNavigator(BaseNavigator):
-    def __init__(self, url: str):
+    def __init__(self, url: str, lean: bool = False, blocked_hosts: list = None, browser: SharedBrowser = None):
         """Initializes the TrNavigator with a Firefox driver."""
-        super().__init__(url=url)
+        super().__init__(url=url, lean=lean, blocked_hosts=blocked_hosts, browser=browser)
 
     def get_shadow_root(self, element):
         """A helper function to get the shadow root of a web element."""
@@ -18,13 +17,13 @@ class TrNavigator(BaseNavigator):
 
     def get_keyboard_container(self):
         """Navigates through the nested Shadow DOM to find the keyboard container."""
-        game_app = WebDriverWait(self.driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "game-app")))
+        game_app = self.wait_until(EC.presence_of_element_located((By.TAG_NAME, "game-app")), 15)
         game_app_shadow_root = self.get_shadow_root(game_app)
 
-        game_keyboard = WebDriverWait(game_app_shadow_root, 15).until(EC.presence_of_element_located((By.CSS_SELECTOR, "game-keyboard")))
+        game_keyboard = self.wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, "game-keyboard")), 15, game_app_shadow_root)
         keyboard_shadow_root = self.get_shadow_root(game_keyboard)
 
-        keyboard_container = WebDriverWait(keyboard_shadow_root, 15).until(EC.presence_of_element_located((By.ID, "keyboard")))
+        keyboard_container = self.wait_until(EC.presence_of_element_located((By.ID, "keyboard")), 15, keyboard_shadow_root)
         return keyboard_container
 
     def type_word(self, word_to_type: str):
@@ -37,7 +36,7 @@ class TrNavigator(BaseNavigator):
         for letter in word_to_type:
             key_element = keyboard_container.find_element(By.CSS_SELECTOR, f"button[data-key='{letter.lower()}']")
             self.driver.execute_script("arguments[0].click();", key_element)
-            time.sleep(1)
+            self.pause(1)
 
         enter_key = keyboard_container.find_element(By.CSS_SELECTOR, "button[data-key='↵']")
         self.driver.execute_script("arguments[0].click();", enter_key)
@@ -51,7 +50,7 @@ class TrNavigator(BaseNavigator):
         for _ in range(length):
             # backspace_key.click()
             self.driver.execute_script("arguments[0].click();", backspace_key)
-            time.sleep(0.5)
+            self.pause(0.5)
 
     def read_result(self, attempt_index: int) -> str:
         """Reads the result (colors) from a specific row after a guess."""
@@ -62,38 +61,38 @@ class TrNavigator(BaseNavigator):
             game_app = self.driver.find_element(By.TAG_NAME, 'game-app')
             game_app_shadow_root = self.get_shadow_root(game_app)
 
-            game_div = WebDriverWait(game_app_shadow_root, 10).until(
-                EC.presence_of_element_located((By.ID, 'game'))
+            game_div = self.wait_until(
+                EC.presence_of_element_located((By.ID, 'game')), 10, game_app_shadow_root
             )
-            board_container = WebDriverWait(game_div, 10).until(
-                EC.presence_of_element_located((By.ID, 'board-container'))
+            board_container = self.wait_until(
+                EC.presence_of_element_located((By.ID, 'board-container')), 10, game_div
             )
-            board = WebDriverWait(board_container, 10).until(
-                EC.presence_of_element_located((By.ID, 'board'))
+            board = self.wait_until(
+                EC.presence_of_element_located((By.ID, 'board')), 10, board_container
             )
 
             # 4. Now we are in the correct context to find the row
             row_selector = f"game-row:nth-of-type({attempt_index + 1})"
-            row_element = WebDriverWait(board, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, row_selector))
+            row_element = self.wait_until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, row_selector)), 5, board
             )
 
             # 5. Wait for the evaluation to be complete on the last tile of that row.
             row_shadow_root = self.get_shadow_root(row_element)
             last_tile_selector = "game-tile:nth-of-type(5)"
-            last_tile = WebDriverWait(row_shadow_root, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, last_tile_selector))
+            last_tile = self.wait_until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, last_tile_selector)), 5, row_shadow_root
             )
 
             # The final and most reliable wait: wait until the 'evaluation' attribute is not null.
             try:
-                WebDriverWait(self.driver, 5).until(
-                    lambda d: last_tile.get_attribute("evaluation") is not None
+                self.wait_until(
+                    lambda d: last_tile.get_attribute("evaluation") is not None, 5
                 )
             except TimeoutException:
                 last_tile_shadow_root = self.get_shadow_root(last_tile)
-                last_tile = WebDriverWait(last_tile_shadow_root, 5).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "tile"))
+                last_tile = self.wait_until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "tile")), 5, last_tile_shadow_root
                 )
 
         except TimeoutException as e:
@@ -110,8 +109,8 @@ class TrNavigator(BaseNavigator):
             status = tile.get_attribute("evaluation")
             if status is None:
                 tile_shadow_root = self.get_shadow_root(tile)
-                tile = WebDriverWait(tile_shadow_root, 5).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "tile"))
+                tile = self.wait_until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "tile")), 5, tile_shadow_root
                 )
                 status = tile.get_attribute("data-state")
 
@@ -128,18 +127,39 @@ class TrNavigator(BaseNavigator):
         print(f"Result found: {result}")
         return result
 
+    def read_board(self) -> list:
+        """Reads back the evaluated rows already on the board, walking the shadow roots in a single script call."""
+        rows = self.driver.execute_script("""
+            const gameApp = document.querySelector("game-app");
+            const board = gameApp && gameApp.shadowRoot && gameApp.shadowRoot.querySelector("#board");
+            if (!board) {
+                return [];
+            }
+            return Array.from(board.querySelectorAll("game-row")).map((row) =>
+                Array.from(row.shadowRoot ? row.shadowRoot.querySelectorAll("game-tile") : []).map((tile) => {
+                    const inner = tile.shadowRoot && tile.shadowRoot.querySelector(".tile");
+                    return [
+                        tile.getAttribute("letter") || (inner ? inner.textContent.trim() : ""),
+                        tile.getAttribute("evaluation") || (inner ? inner.getAttribute("data-state") : null),
+                    ];
+                })
+            );
+        """)
+        tr_translator = str.maketrans("öüğşiçı", "ÖÜĞŞİÇI")
+        return self._history_from_tiles(rows, to_upper=lambda letter: letter.translate(tr_translator).upper())
+
     def read_final_result(self, history: list) -> str:
         """Reads the final result (colors) from the last row after all guesses."""
         print("Reading final result...")
         try:
-            time.sleep(1)
+            self.pause(1)
 
             # 1. Get the top-level game-app and its shadow root
             game_app = self.driver.find_element(By.TAG_NAME, "game-app")
             game_app_shadow_root = self.get_shadow_root(game_app)
 
-            game_div = WebDriverWait(game_app_shadow_root, 10).until(
-                EC.presence_of_element_located((By.ID, "game"))
+            game_div = self.wait_until(
+                EC.presence_of_element_located((By.ID, "game")), 10, game_app_shadow_root
             )
             # find the game-stats element
             game_modal = game_div.find_element(By.TAG_NAME, "game-modal")
@@ -147,12 +167,13 @@ class TrNavigator(BaseNavigator):
             game_stats_shadow_root = self.get_shadow_root(game_stats)
 
             # get the share button
-            share_button = WebDriverWait(game_stats_shadow_root, 10).until(
-                EC.presence_of_element_located((By.ID, "share-button"))
+            share_button = self.wait_until(
+                EC.presence_of_element_located((By.ID, "share-button")), 10, game_stats_shadow_root
             )
             if share_button:
                 share_button.click()
 
+            # Keep the shared browser until the clipboard is read: other windows share the clipboard.
             time.sleep(1)  # Wait for the share modal to open
             try:
                 return self.driver.execute_script("return navigator.clipboard.readText();")
@@ -167,23 +188,26 @@ class TrNavigator(BaseNavigator):
         """Sets up the navigator."""
         print("Setting up the navigator for TR Wordle...")
         super().setup()
-        self.driver.get(self.url)
+        start = time.perf_counter()
+        self.load_page(self.url)
+        self.timings["page_load"] = time.perf_counter() - start
         self.get_keyboard_container()
+        self.timings["time_to_keyboard"] = time.perf_counter() - start
         print("Game keyboard loaded.")
         try:
             game_app = self.driver.find_element(By.TAG_NAME, 'game-app')
             game_app_shadow_root = self.get_shadow_root(game_app)
-            close_icon = WebDriverWait(game_app_shadow_root, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, 'div.close-icon'))
+            close_icon = self.wait_until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, 'div.close-icon')), 10, game_app_shadow_root
             )
             print("Closing the help pop-up.")
             close_icon.click()
-            time.sleep(1)
+            self.pause(1)
         except TimeoutException:
             print("Help pop-up not found or already closed.")
 
         # type a dummy letter to avoid missing the first letter in the first guess
         self.type_word("A")
-        time.sleep(0.5)
+        self.pause(0.5)
         self.clear_word(1)
-        time.sleep(0.5)
+        self.pause(0.5)
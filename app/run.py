@@ -3,7 +3,7 @@ Core Wordle bot game logic.
 This module contains the main game runner function.
 """
 import time
-from typing import Union
+from typing import Callable, Optional, Union
 
 from .navigator.tr_navigator import TrNavigator
 from .navigator.en_navigator import EnNavigator
@@ -12,44 +12,131 @@ from .agents.tr_agent import TrAgent
 from .agents.en_agent import EnAgent
 
 
-def run_game(navigator: Union[EnNavigator, TrNavigator], agent: Union[EnAgent, TrAgent]):
+class GuessLimitError(RuntimeError):
+    """Raised when a game exceeds its limit of proposed guesses."""
+
+
+def _emit(on_event: Optional[Callable[[dict], None]], event_type: str, **data):
+    """Sends a structured progress event to the listener, if any."""
+    if on_event is None:
+        return
+    try:
+        on_event({"type": event_type, "timestamp": time.time(), **data})
+    except Exception as e:
+        print(f"Event listener failed on '{event_type}': {e}")
+
+
+def _restore_history(navigator, history: list) -> list:
+    """
+    Brings the page back in line with a checkpointed history after a restart.
+
+    Rows already on the board are kept; checkpointed guesses missing from the board
+    (e.g. after the browser died and a fresh one was started) are typed again, which
+    costs no LLM calls. If the board disagrees with the checkpoint, the board wins.
+
+    Returns:
+        list: The history to continue the game from.
+    """
+    with navigator.active():
+        board = navigator.read_board()
+    valid_turns = [turn for turn in history if turn["feedback"] != "INVALID"]
+    if [turn["guess"] for turn in board] != [turn["guess"] for turn in valid_turns[:len(board)]]:
+        print("The board on the page does not match the checkpoint. Continuing from the board.")
+        return board
+
+    replayed = []
+    for attempt, turn in enumerate(valid_turns[len(board):], start=len(board)):
+        print(f"Replaying checkpointed guess for turn {attempt + 1}: {turn['guess']}")
+        with navigator.active():
+            navigator.type_word(turn["guess"])
+        time.sleep(navigator.settle_delay)
+        with navigator.active():
+            feedback = navigator.read_result(attempt)
+        if feedback != turn["feedback"]:
+            print(f"Replayed guess got {feedback} instead of {turn['feedback']}. Continuing from the board.")
+            if feedback == "INVALID":
+                with navigator.active():
+                    navigator.clear_word(len(turn["guess"]))
+            else:
+                replayed.append({"guess": turn["guess"], "feedback": feedback})
+            return board + replayed
+        replayed.append(turn)
+    return history
+
+
+def run_game(
+        navigator: Union[EnNavigator, TrNavigator],
+        agent: Union[EnAgent, TrAgent],
+        on_event: Optional[Callable[[dict], None]] = None,
+        history: Optional[list] = None,
+        on_checkpoint: Optional[Callable[[list], None]] = None,
+        max_guesses: Optional[int] = None
+):
     """
     Runs the Wordle bot for the specified language.
 
+    Navigator calls are made inside `navigator.active()`, so games sharing one browser
+    take turns on the driver while the others sleep or wait for the LLM.
+
     Args:
         navigator: The navigator instance for the target site
         agent: The AI agent instance for the language
+        on_event: Optional callback receiving progress events as dicts with a "type" key
+            (game_started, game_resumed, guess_proposed, guess_rejected, feedback_read, game_finished)
+        history: Optional checkpointed history to resume the game from
+        on_checkpoint: Optional callback receiving the history after every completed turn
+        max_guesses: Optional limit on guesses proposed in the game, rejected ones included
+
+    Raises:
+        GuessLimitError: If the game proposed more than `max_guesses` guesses.
 
     Returns:
         dict: Game result containing won status, attempts, history, etc.
     """
-    history = []
-    won = False
+    history = list(history or [])
+    _emit(on_event, "game_started", url=navigator.url, model=agent.model)
 
-    for i in range(6): 
+    history = _restore_history(navigator, history)
+    valid_turns = [turn for turn in history if turn["feedback"] != "INVALID"]
+    won = bool(valid_turns) and valid_turns[-1]["feedback"] == "GGGGG"
+    current_attempt = len(valid_turns) - 1
+    guess = valid_turns[-1]["guess"] if valid_turns else None
+    if valid_turns:
+        print(f"Resuming the game after {len(valid_turns)} completed attempt(s).")
+        _emit(on_event, "game_resumed", attempts=len(valid_turns), history=history)
+
+    for i in range(len(valid_turns), 0 if won else 6):
         current_attempt = i
         invalid_counter = 0
         use_simple_word = False
 
         while True:
+            if max_guesses is not None and len(history) >= max_guesses:
+                raise GuessLimitError(f"Gave up after {len(history)} guesses without finishing the game.")
             print(f"\nTurn {current_attempt + 1}")
             if use_simple_word:
                 guess = agent.simple_word
                 use_simple_word = False
             else:
                 guess = agent.get_ai_guess(history)
+            _emit(on_event, "guess_proposed", attempt=current_attempt + 1, guess=guess)
             if len(guess) != 5:
                 history.append({"guess": guess, "feedback": "INVALID"})
+                _emit(on_event, "guess_rejected", attempt=current_attempt + 1, guess=guess, reason="INVALID_LENGTH")
                 continue
 
-            navigator.type_word(guess)
-            time.sleep(5) 
+            with navigator.active():
+                navigator.type_word(guess)
+            time.sleep(navigator.settle_delay) 
 
-            feedback = navigator.read_result(current_attempt)
+            with navigator.active():
+                feedback = navigator.read_result(current_attempt)
             if feedback == "INVALID":
                 print(f"Invalid word: {guess}. Invalid attempts: {invalid_counter + 1}")
                 history.append({"guess": guess, "feedback": "INVALID"})
-                navigator.clear_word(len(guess))
+                _emit(on_event, "guess_rejected", attempt=current_attempt + 1, guess=guess, reason="INVALID")
+                with navigator.active():
+                    navigator.clear_word(len(guess))
 
                 invalid_counter += 1
                 if invalid_counter > 5:
@@ -58,8 +145,12 @@ def run_game(navigator: Union[EnNavigator, TrNavigator], agent: Union[EnAgent, T
                     print(f"Invalid attempts exceeded. Using simple word: {agent.simple_word}")
             else:
                 history.append({"guess": guess, "feedback": feedback})
+                _emit(on_event, "feedback_read", attempt=current_attempt + 1, guess=guess, feedback=feedback)
                 break
 
+        if on_checkpoint is not None:
+            on_checkpoint(history)
+
         if feedback == "GGGGG":
             won = True
             break
@@ -69,11 +160,13 @@ def run_game(navigator: Union[EnNavigator, TrNavigator], agent: Union[EnAgent, T
     else:
         print("FAILED! Could not solve in 6 attempts.")
 
-    shareable_output = navigator.read_final_result(history)
-    navigator.close_browser()
+    with navigator.active():
+        shareable_output = navigator.read_final_result(history)
+        navigator.close_browser()
+    _emit(on_event, "game_finished", won=won, attempts=current_attempt + 1, result=shareable_output)
     return {
         "won": won,
         "attempts": current_attempt + 1,
         "history": history,
         "result": shareable_output,
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,293 @@
+"""
+Tournament mode for offline comparison of strategies.
+
+Every strategy plays the same deterministic sample of hidden answers in offline
+games, spread over worker processes. Results stream into the database as they
+finish, and a report with win rates, guess distributions and confidence
+intervals is printed at the end.
+
+Usage:
+    python -m app.tournament --language en --answers answers.txt \
+        --strategy gpt-4o-mini:0.3 --strategy gpt-4o-mini:0.7 --games 200
+"""
+import argparse
+import io
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+
+from .agents.en_agent import EnAgent
+from .agents.tr_agent import TrAgent
+from .db import Database
+from .navigator.offline_navigator import OfflineNavigator
+from .run import run_game
+from .words import load_words
+
+AGENTS = {"en": EnAgent, "tr": TrAgent}
+
+# Guesses an offline game may propose, rejected ones included, before it is reported as an error.
+MAX_OFFLINE_GUESSES = 30
+
+# Per-process state of the worker processes, set up once by _init_worker.
+_worker = {}
+
+
+def _is_float(value: str) -> bool:
+    """Whether the string parses as a float."""
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_strategy(spec: str) -> dict:
+    """
+    Parses a strategy spec of the form `model[:temperature[:system_prompt_file]]`.
+
+    Model IDs may contain colons themselves (fine-tunes look like `ft:gpt-4o-mini:org::id`),
+    so the spec is split from the right: the trailing parts are only taken as the temperature
+    and prompt file when they parse as a float and name an existing file.
+
+    Returns:
+        dict: The strategy name (the spec itself), model, temperature and system prompt.
+    """
+    model, temperature, prompt_file = spec, None, None
+    parts = spec.rsplit(":", 2)
+    if len(parts) == 3 and os.path.isfile(parts[2]) and (not parts[1] or _is_float(parts[1])):
+        model, temperature, prompt_file = parts
+    elif len(parts) == 3 and _is_float(parts[1]):
+        raise FileNotFoundError(f"System prompt file of strategy {spec} not found: {parts[2]}")
+    else:
+        parts = spec.rsplit(":", 1)
+        if len(parts) == 2 and _is_float(parts[1]):
+            model, temperature = parts
+    if not model:
+        raise ValueError(f"Invalid strategy spec: {spec}")
+
+    system_prompt = None
+    if prompt_file:
+        with open(prompt_file, encoding="utf-8") as f:
+            system_prompt = f.read()
+    return {
+        "name": spec,
+        "model": model,
+        "temperature": float(temperature) if temperature else None,
+        "system_prompt": system_prompt,
+    }
+
+
+def _init_worker(language: str, valid_words: list, use_opening_book: bool):
+    """Sets up a worker process."""
+    _worker["language"] = language
+    _worker["valid_words"] = valid_words
+    _worker["use_opening_book"] = use_opening_book
+    _worker["agents"] = {}
+
+
+def _get_agent(strategy: dict):
+    """Returns the worker's agent for a strategy, creating it on first use."""
+    agent = _worker["agents"].get(strategy["name"])
+    if agent is None:
+        agent_class = AGENTS[_worker["language"]]
+        kwargs = {"model": strategy["model"], "use_opening_book": _worker["use_opening_book"]}
+        if strategy["temperature"] is not None:
+            kwargs["temperature"] = strategy["temperature"]
+        agent = agent_class(**kwargs)
+        if strategy["system_prompt"] is not None:
+            agent.system_prompt = strategy["system_prompt"]
+        # A game the model could not play must count as an error, not as a game of fallback words.
+        agent.allow_fallback = False
+        _worker["agents"][strategy["name"]] = agent
+    return agent
+
+
+def _play_offline(strategy: dict, answer: str, seed: int) -> dict:
+    """Plays one offline game in a worker process."""
+    outcome = {"strategy": strategy["name"], "answer": answer, "seed": seed}
+    try:
+        agent = _get_agent(strategy)
+        agent.seed = seed
+        navigator = OfflineNavigator(answer, language=_worker["language"], valid_words=_worker["valid_words"])
+        with redirect_stdout(io.StringIO()):
+            result = run_game(navigator, agent, max_guesses=MAX_OFFLINE_GUESSES)
+        outcome.update(won=result["won"], attempts=result["attempts"], history=result["history"])
+    except Exception as e:
+        outcome["error"] = str(e)
+    return outcome
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple:
+    """Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return 0.0, 0.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+def summarize(results: list) -> dict:
+    """
+    Aggregates finished games per strategy.
+
+    Returns:
+        dict: Per strategy: games, errors, wins, win_rate, win_rate_ci, mean_guesses,
+        mean_guesses_ci (over won games) and distribution (guesses 1-6, X for losses).
+    """
+    summary = {}
+    for strategy in dict.fromkeys(result["strategy"] for result in results):
+        games = [result for result in results if result["strategy"] == strategy]
+        played = [game for game in games if "error" not in game]
+        won = [game["attempts"] for game in played if game["won"]]
+
+        distribution = {str(n): 0 for n in range(1, 7)}
+        distribution["X"] = 0
+        for game in played:
+            distribution[str(game["attempts"]) if game["won"] else "X"] += 1
+
+        mean = sum(won) / len(won) if won else float("nan")
+        if len(won) > 1:
+            std = math.sqrt(sum((n - mean) ** 2 for n in won) / (len(won) - 1))
+            margin = 1.96 * std / math.sqrt(len(won))
+        else:
+            margin = float("nan")
+
+        summary[strategy] = {
+            "games": len(played),
+            "errors": len(games) - len(played),
+            "wins": len(won),
+            "win_rate": len(won) / len(played) if played else 0.0,
+            "win_rate_ci": wilson_interval(len(won), len(played)),
+            "mean_guesses": mean,
+            "mean_guesses_ci": (mean - margin, mean + margin),
+            "distribution": distribution,
+        }
+    return summary
+
+
+def print_report(summary: dict, use_opening_book: bool = False):
+    """Prints the tournament report."""
+    print(f"\nOpening book: {'on, turns 1-2 are played from the book' if use_opening_book else 'off'}")
+    print(f"{'strategy':<32} {'games':>6} {'win rate (95% CI)':>24} {'mean guesses (95% CI)':>24}  distribution 1-6/X")
+    for strategy, stats in sorted(summary.items(), key=lambda item: -item[1]["win_rate"]):
+        low, high = stats["win_rate_ci"]
+        mean_low, mean_high = stats["mean_guesses_ci"]
+        distribution = " ".join(str(count) for count in stats["distribution"].values())
+        errors = f"  ({stats['errors']} errors)" if stats["errors"] else ""
+        print(
+            f"{strategy:<32} {stats['games']:>6} "
+            f"{stats['win_rate']:>7.1%} [{low:>5.1%}, {high:>5.1%}] "
+            f"{stats['mean_guesses']:>8.2f} [{mean_low:>5.2f}, {mean_high:>5.2f}]  {distribution}{errors}"
+        )
+
+
+def run_tournament(
+        language: str,
+        strategies: list,
+        answers: list,
+        games: int = 100,
+        seed: int = 0,
+        workers: int = None,
+        valid_words: list = None,
+        tournament_id: str = None,
+        db: Database = None,
+        use_opening_book: bool = False
+) -> dict:
+    """
+    Plays every strategy against the same deterministic sample of answers.
+
+    Args:
+        language (str): The language of the games.
+        strategies (list): Strategy specs, see `parse_strategy`.
+        answers (list): The pool of hidden answers to sample from.
+        games (int): Number of answers each strategy plays.
+        seed (int): Seed for the answer sample and the per-game model seeds.
+        workers (int): Worker processes. Defaults to the number of CPUs.
+        valid_words (list): Accepted guesses. If not given, any 5-letter word is accepted.
+        tournament_id (str): Identifier under which results are stored.
+        db (Database): Database to stream results into, if any.
+        use_opening_book (bool): Whether agents play the opening book. Off by default, as book
+            moves are the same for every strategy and hide their differences on turns 1-2.
+
+    Returns:
+        dict: The per-strategy summary, see `summarize`.
+    """
+    parsed = [parse_strategy(spec) for spec in strategies]
+    rng = random.Random(seed)
+    sample = rng.sample(answers, min(games, len(answers)))
+    game_seeds = [rng.randrange(2 ** 31) for _ in sample]
+    tournament_id = tournament_id or time.strftime("%Y%m%d-%H%M%S")
+
+    print(f"Tournament {tournament_id}: {len(parsed)} strategies x {len(sample)} games on {workers or os.cpu_count()} workers, "
+          f"opening book {'on' if use_opening_book else 'off'}.")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(language, valid_words, use_opening_book)) as executor:
+        futures = [
+            executor.submit(_play_offline, strategy, answer, game_seed)
+            for answer, game_seed in zip(sample, game_seeds)
+            for strategy in parsed
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results.append(result)
+            if "error" in result:
+                print(f"[{done}/{len(futures)}] {result['strategy']} on {result['answer']}: error: {result['error']}")
+                continue
+            if db is not None:
+                db.save_tournament_result(
+                    tournament_id=tournament_id,
+                    strategy=result["strategy"],
+                    language=language,
+                    seed=result["seed"],
+                    answer=result["answer"],
+                    won=result["won"],
+                    attempts=result["attempts"],
+                    history=result["history"]
+                )
+            outcome = f"won in {result['attempts']}" if result["won"] else "lost"
+            print(f"[{done}/{len(futures)}] {result['strategy']} on {result['answer']}: {outcome}")
+
+    return summarize(results)
+
+
+def main():
+    """CLI entry point for the tournament runner."""
+    parser = argparse.ArgumentParser(description="Compare Wordle strategies on offline games")
+    parser.add_argument("--language", choices=sorted(AGENTS), default="en", help="Language to play (en/tr)")
+    parser.add_argument("--answers", required=True, help="File with the pool of hidden answers, one per line")
+    parser.add_argument("--words", help="File with accepted guesses; any 5-letter word is accepted if omitted")
+    parser.add_argument("--strategy", action="append", required=True, help="model[:temperature[:system_prompt_file]], repeatable")
+    parser.add_argument("--games", type=int, default=100, help="Answers each strategy plays")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the answer sample and model seeds")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--tournament-id", default=None, help="Identifier for stored results")
+    parser.add_argument("--no-db", action="store_true", help="Don't save results to database")
+    book = parser.add_mutually_exclusive_group()
+    book.add_argument("--opening-book", dest="opening_book", action="store_true", help="Play turns 1-2 from the opening book")
+    book.add_argument("--no-opening-book", dest="opening_book", action="store_false", help="Let the model play every turn (default)")
+
+    args = parser.parse_args()
+    answers = load_words(args.answers, args.language)
+    valid_words = load_words(args.words, args.language) if args.words else None
+    summary = run_tournament(
+        args.language,
+        args.strategy,
+        answers,
+        games=args.games,
+        seed=args.seed,
+        workers=args.workers,
+        valid_words=valid_words,
+        tournament_id=args.tournament_id,
+        db=None if args.no_db else Database(),
+        use_opening_book=args.opening_book
+    )
+    print_report(summary, use_opening_book=args.opening_book)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Word list helpers and local Wordle scoring.
+Used to play offline games against a known answer and to encode feedback compactly.
+"""
+TR_UPPER = str.maketrans("iıöüğşç", "İIÖÜĞŞÇ")
+
+FEEDBACK_DIGITS = {"B": 0, "Y": 1, "G": 2}
+
+
+def to_upper(word: str, language: str = "en") -> str:
+    """Uppercases a word, mapping Turkish dotted and dotless i correctly for "tr"."""
+    if language == "tr":
+        word = word.translate(TR_UPPER)
+    return word.upper()
+
+
+def load_words(path: str, language: str = "en") -> list:
+    """
+    Loads a word list with one word per line.
+
+    Words are uppercased; entries that are not five letters are skipped and duplicates dropped.
+    """
+    words = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            word = to_upper(line.strip(), language)
+            if len(word) == 5 and word.isalpha():
+                words[word] = None
+    return list(words)
+
+
+def score_guess(guess: str, answer: str) -> str:
+    """
+    Scores a guess against the answer the way Wordle does.
+
+    Returns:
+        str: Feedback with G (green), Y (yellow) and B (gray) per position. Repeated
+        letters are only marked yellow as many times as they remain unmatched in the answer.
+    """
+    feedback = ["B"] * len(guess)
+    remaining = {}
+    for i, (letter, target) in enumerate(zip(guess, answer)):
+        if letter == target:
+            feedback[i] = "G"
+        else:
+            remaining[target] = remaining.get(target, 0) + 1
+
+    for i, letter in enumerate(guess):
+        if feedback[i] != "G" and remaining.get(letter, 0) > 0:
+            feedback[i] = "Y"
+            remaining[letter] -= 1
+    return "".join(feedback)
+
+
+def feedback_to_int(feedback: str) -> int:
+    """Encodes a feedback string as a base-3 integer (B=0, Y=1, G=2, first letter most significant)."""
+    value = 0
+    for mark in feedback:
+        value = value * 3 + FEEDBACK_DIGITS[mark]
+    return value
+
+
+def int_to_feedback(value: int, length: int = 5) -> str:
+    """Decodes a base-3 integer back into a feedback string."""
+    marks = "BYG"
+    feedback = []
+    for _ in range(length):
+        value, digit = divmod(value, 3)
+        feedback.append(marks[digit])
+    return "".join(reversed(feedback))
@@ -0,0 +1,111 @@
+"""
+Local HTTP server for the Wordle fixture pages.
+
+Serves `benchmarks/fixtures` on a loopback port. Paths under `/heavy/` return
+synthetic, deliberately slow payloads standing in for the images, fonts and
+third-party scripts of the real sites. HTML pages are rendered with
+`{{THIRD_PARTY_ORIGIN}}` pointing at a `.localhost` alias of the same server,
+so that host can be blocked independently of the game itself.
+"""
+import os
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+THIRD_PARTY_HOST = "tracker.localhost"
+HEAVY_DELAY = 0.3
+HEAVY_SIZE = 256 * 1024
+
+# Answer and a scripted winning sequence of guesses for each fixture site.
+FIXTURE_GAMES = {
+    "en": ("crane", ["slate", "trace", "crane"]),
+    "tr": ("sorun", ["tenis", "sabun", "somun", "sorun"]),
+}
+
+HEAVY_CONTENT_TYPES = {
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".woff2": "font/woff2",
+}
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serves fixture files, rendered HTML pages and synthetic heavy assets."""
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path.startswith("/heavy/"):
+            self._send_heavy(path)
+        elif path.endswith("/") or path.endswith(".html"):
+            self._send_page(path)
+        else:
+            super().do_GET()
+
+    def _send_heavy(self, path: str):
+        """Sends a slow, padded payload whose content is harmless for its type."""
+        time.sleep(HEAVY_DELAY)
+        content_type = HEAVY_CONTENT_TYPES.get(os.path.splitext(path)[1], "application/octet-stream")
+        if content_type in ("application/javascript", "text/css"):
+            body = b"/*" + b" " * HEAVY_SIZE + b"*/\n"
+        else:
+            body = b"\0" * HEAVY_SIZE
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_page(self, path: str):
+        """Sends an HTML page with the third-party origin filled in."""
+        file_path = self.translate_path(path)
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, "index.html")
+        if not os.path.isfile(file_path):
+            self.send_error(404)
+            return
+        with open(file_path, encoding="utf-8") as f:
+            html = f.read()
+        origin = f"http://{THIRD_PARTY_HOST}:{self.server.server_address[1]}"
+        body = html.replace("{{THIRD_PARTY_ORIGIN}}", origin).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keeps benchmark output readable."""
+
+
+class FixtureServer:
+    """Runs the fixture server in a background thread for the duration of a `with` block."""
+
+    def __init__(self, port: int = 0):
+        handler = partial(FixtureHandler, directory=FIXTURES_DIR)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """The root URL of the fixture pages."""
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def url(self, language: str, **params) -> str:
+        """The URL of a language's fixture page with the given query parameters."""
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        return f"{self.base_url}/{language}/" + (f"?{query}" if query else "")
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
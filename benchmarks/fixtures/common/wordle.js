@@ -0,0 +1,95 @@
+// Minimal Wordle engine shared by the local fixture pages.
+// Query parameters: answer (default set by the page), reveal (ms before tiles are evaluated, default 0),
+// strict (0 accepts any 5-letter word, default 1 only accepts WORDS).
+(function () {
+  const WORDS = (
+    "crane slate arise adieu stare raise trace crate irate later alert alter " +
+    "react cater learn plant plane train brain grain drain stain saint paint " +
+    "mount count cloud could would round sound pound found bound other about " +
+    "their there these three those where which while white whole world words " +
+    "marsh trash crash brash flash clash smash stash robot orbit solid sonar " +
+    "tenis sabun somun sorun selam kalem kitap masal zaman insan bilgi ağaç " +
+    "çiçek güneş şeker ölçek dünya hayat sıcak ışık"
+  ).split(/\s+/);
+
+  function lower(word) {
+    return word.toLocaleLowerCase("tr-TR");
+  }
+
+  function evaluate(guess, answer) {
+    const result = Array(guess.length).fill("absent");
+    const remaining = {};
+    for (let i = 0; i < answer.length; i++) {
+      if (guess[i] === answer[i]) {
+        result[i] = "correct";
+      } else {
+        remaining[answer[i]] = (remaining[answer[i]] || 0) + 1;
+      }
+    }
+    for (let i = 0; i < guess.length; i++) {
+      if (result[i] !== "correct" && remaining[guess[i]]) {
+        result[i] = "present";
+        remaining[guess[i]] -= 1;
+      }
+    }
+    return result;
+  }
+
+  class FixtureGame {
+    constructor(listener, defaultAnswer = "crane") {
+      const params = new URLSearchParams(window.location.search);
+      this.answer = lower(params.get("answer") || defaultAnswer);
+      this.reveal = parseInt(params.get("reveal") || "0", 10);
+      this.strict = params.get("strict") !== "0";
+      this.rows = Array.from({ length: 6 }, () => ({ letters: [], evaluation: null }));
+      this.rowIndex = 0;
+      this.status = "IN_PROGRESS";
+      this.listener = listener;
+    }
+
+    get current() {
+      return this.rows[this.rowIndex];
+    }
+
+    press(key) {
+      if (this.status !== "IN_PROGRESS") {
+        return;
+      }
+      if (key === "↵" || key === "enter") {
+        this.submit();
+      } else if (key === "←" || key === "backspace") {
+        this.current.letters.pop();
+        this.listener.onRowChanged(this.rowIndex);
+      } else if (this.current.letters.length < 5) {
+        this.current.letters.push(lower(key));
+        this.listener.onRowChanged(this.rowIndex);
+      }
+    }
+
+    submit() {
+      const row = this.current;
+      const word = row.letters.join("");
+      if (word.length !== 5 || (this.strict && !WORDS.includes(word) && word !== this.answer)) {
+        this.listener.onInvalid(this.rowIndex);
+        return;
+      }
+      const index = this.rowIndex;
+      this.rowIndex += 1;
+      if (word === this.answer) {
+        this.status = "WIN";
+      } else if (this.rowIndex >= this.rows.length) {
+        this.status = "FAIL";
+      }
+      const status = this.status;
+      setTimeout(() => {
+        row.evaluation = evaluate(word, this.answer);
+        this.listener.onRowChanged(index);
+        if (status !== "IN_PROGRESS") {
+          this.listener.onFinished(status);
+        }
+      }, this.reveal);
+    }
+  }
+
+  window.FixtureGame = FixtureGame;
+})();
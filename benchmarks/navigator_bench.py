@@ -0,0 +1,161 @@
+"""
+Micro-benchmarks of the navigators against the local fixture sites.
+
+Plays scripted games with EnNavigator and TrNavigator in headless Firefox
+against the local fixture pages, and reports the latency and the number of
+WebDriver round trips of every navigator call (setup, type_word, read_result,
+clear_word, read_board, read_final_result). No live site is involved, so
+navigator changes can be measured offline and checked against the DOM
+structures the navigators expect.
+
+Usage (from the project root, with geckodriver in place):
+    python -m benchmarks.navigator_bench --language en tr --runs 3
+"""
+import argparse
+import json
+import statistics
+import time
+from collections import defaultdict
+
+from app.navigator.en_navigator import EnNavigator
+from app.navigator.tr_navigator import TrNavigator
+from benchmarks.fixture_server import FIXTURE_GAMES, FixtureServer, THIRD_PARTY_HOST
+
+NAVIGATORS = {"en": EnNavigator, "tr": TrNavigator}
+
+# A guess each fixture rejects, to exercise the invalid-word path and clear_word.
+INVALID_GUESSES = {"en": "xxxxx", "tr": "ğğğğğ"}
+
+
+class RoundTripCounter:
+    """Counts the WebDriver commands sent by a driver, including those of its elements and shadow roots."""
+
+    def __init__(self):
+        self.count = 0
+
+    def attach(self, driver):
+        """Starts counting the commands of the driver."""
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.count += 1
+            return execute(driver_command, params)
+
+        # WebElement and ShadowRoot commands also go through the driver's execute.
+        driver.execute = counted_execute
+
+
+def counted_navigator(navigator_class, counter: RoundTripCounter):
+    """A subclass of the navigator whose driver is counted from its creation, so setup is measured too."""
+
+    class CountedNavigator(navigator_class):
+        def setup_driver(self):
+            driver = super().setup_driver()
+            counter.attach(driver)
+            return driver
+
+    return CountedNavigator
+
+
+class Recorder:
+    """Collects latency and round trips per navigator call."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def measure(self, name: str, counter: RoundTripCounter, call, *args):
+        """Runs one navigator call and records its latency and round trips."""
+        before = counter.count
+        start = time.perf_counter()
+        result = call(*args)
+        self.samples[name].append((time.perf_counter() - start, counter.count - before))
+        return result
+
+    def summary(self) -> dict:
+        """Per call: count, mean/median/max latency in ms and mean round trips."""
+        summary = {}
+        for name, samples in self.samples.items():
+            latencies = [latency * 1000 for latency, _ in samples]
+            summary[name] = {
+                "calls": len(samples),
+                "mean_ms": statistics.mean(latencies),
+                "p50_ms": statistics.median(latencies),
+                "max_ms": max(latencies),
+                "round_trips": statistics.mean(trips for _, trips in samples),
+            }
+        return summary
+
+
+def run_game(language: str, server: FixtureServer, recorder: Recorder, lean: bool, settle: float) -> bool:
+    """Plays one scripted fixture game, recording every navigator call. Returns whether it was read correctly."""
+    answer, guesses = FIXTURE_GAMES[language]
+
+    counter = RoundTripCounter()
+    navigator = recorder.measure(
+        "setup",
+        counter,
+        counted_navigator(NAVIGATORS[language], counter),
+        server.url(language, answer=answer),
+        lean,
+        [THIRD_PARTY_HOST],
+    )
+
+    try:
+        invalid = INVALID_GUESSES[language]
+        recorder.measure("type_word", counter, navigator.type_word, invalid)
+        time.sleep(settle)
+        ok = recorder.measure("read_result (invalid)", counter, navigator.read_result, 0) == "INVALID"
+        recorder.measure("clear_word", counter, navigator.clear_word, len(invalid))
+
+        history = []
+        for attempt, guess in enumerate(guesses):
+            recorder.measure("type_word", counter, navigator.type_word, guess)
+            time.sleep(settle)
+            feedback = recorder.measure("read_result", counter, navigator.read_result, attempt)
+            history.append({"guess": guess, "feedback": feedback})
+
+        board = recorder.measure("read_board", counter, navigator.read_board)
+        ok = ok and history[-1]["feedback"] == "GGGGG"
+        ok = ok and [turn["feedback"] for turn in board] == [turn["feedback"] for turn in history]
+        recorder.measure("read_final_result", counter, navigator.read_final_result, history)
+        return ok
+    finally:
+        navigator.close_browser()
+
+
+def print_report(language: str, summary: dict, ok: bool):
+    """Prints the per-call table for one language."""
+    print(f"\n{language.upper()} fixture ({'all reads correct' if ok else 'READ MISMATCH'})")
+    print(f"{'call':<24} {'calls':>6} {'mean ms':>10} {'p50 ms':>10} {'max ms':>10} {'round trips':>12}")
+    for name, stats in summary.items():
+        print(
+            f"{name:<24} {stats['calls']:>6} {stats['mean_ms']:>10.1f} {stats['p50_ms']:>10.1f} "
+            f"{stats['max_ms']:>10.1f} {stats['round_trips']:>12.1f}"
+        )
+
+
+def main():
+    """CLI entry point for the navigator benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark navigator calls against local fixture sites")
+    parser.add_argument("--language", nargs="+", choices=sorted(NAVIGATORS), default=sorted(NAVIGATORS), help="Fixture sites to run")
+    parser.add_argument("--runs", type=int, default=3, help="Games per language")
+    parser.add_argument("--lean", action="store_true", help="Use the lean browser profile")
+    parser.add_argument("--settle", type=float, default=0.5, help="Seconds to wait between typing and reading a row")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    with FixtureServer() as server:
+        for language in args.language:
+            recorder = Recorder()
+            ok = all(run_game(language, server, recorder, args.lean, args.settle) for _ in range(args.runs))
+            results[language] = {"ok": ok, "calls": recorder.summary()}
+            print_report(language, results[language]["calls"], ok)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
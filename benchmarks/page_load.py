@@ -0,0 +1,73 @@
+"""
+Measures page load and time-to-keyboard of the stock and lean browser profiles.
+
+Runs the navigators against the local fixture pages, then plays one short game
+in each profile to check that the blocked resources do not break gameplay.
+
+Usage (from the project root, with geckodriver in place):
+    python -m benchmarks.page_load --language en --runs 3
+"""
+import argparse
+import statistics
+import time
+
+from app.navigator.en_navigator import EnNavigator
+from app.navigator.tr_navigator import TrNavigator
+from benchmarks.fixture_server import FIXTURE_GAMES, FixtureServer, THIRD_PARTY_HOST
+
+NAVIGATORS = {"en": EnNavigator, "tr": TrNavigator}
+
+
+def play_fixture_game(navigator, guesses: list) -> list:
+    """Plays the given guesses and returns the feedback read for each."""
+    feedback = []
+    for attempt, guess in enumerate(guesses):
+        navigator.type_word(guess)
+        time.sleep(0.5)
+        feedback.append(navigator.read_result(attempt))
+    return feedback
+
+
+def measure(language: str, lean: bool, runs: int, server: FixtureServer) -> dict:
+    """Starts `runs` fresh navigators and collects their setup timings and gameplay check."""
+    answer, guesses = FIXTURE_GAMES[language]
+    timings = {"page_load": [], "time_to_keyboard": []}
+    playable = True
+    for _ in range(runs):
+        navigator = NAVIGATORS[language](
+            url=server.url(language, answer=answer),
+            lean=lean,
+            blocked_hosts=[THIRD_PARTY_HOST],
+        )
+        try:
+            for name in timings:
+                timings[name].append(navigator.timings[name])
+            playable = playable and play_fixture_game(navigator, guesses)[-1] == "GGGGG"
+        finally:
+            navigator.close_browser()
+    return {"timings": timings, "playable": playable}
+
+
+def main():
+    """CLI entry point for the page load benchmark."""
+    parser = argparse.ArgumentParser(description="Compare stock and lean browser page loads on local fixtures")
+    parser.add_argument("--language", choices=sorted(NAVIGATORS), default="en", help="Fixture site to load")
+    parser.add_argument("--runs", type=int, default=3, help="Browser launches per profile")
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        results = {lean: measure(args.language, lean, args.runs, server) for lean in (False, True)}
+
+    print(f"\n{'profile':<8} {'page_load (s)':>14} {'time_to_keyboard (s)':>21} {'playable':>9}")
+    for lean, result in results.items():
+        timings = result["timings"]
+        print(
+            f"{'lean' if lean else 'stock':<8} "
+            f"{statistics.median(timings['page_load']):>14.3f} "
+            f"{statistics.median(timings['time_to_keyboard']):>21.3f} "
+            f"{str(result['playable']):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()